@@ -4,29 +4,184 @@ Input Handler for Multiple Job Posting Formats
 Handles: Screenshots (OCR), URLs (web scraping), PDFs, and text
 """
 
+import asyncio
+import hashlib
+import io
+import json
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 import re
-import requests
-from typing import Optional, Dict
+import httpx
+import numpy as np
+from typing import Optional, Dict, List, Tuple
 from PIL import Image
 import pytesseract
 import PyPDF2
 from bs4 import BeautifulSoup
+import lxml.html
 from urllib.parse import urlparse
 
+try:
+    import fitz  # PyMuPDF
+except ImportError:  # PyPDF2 fallback below
+    fitz = None
+
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+_HTTP_TIMEOUT = 15.0
+
+# On-disk cache for fetched pages and extracted file text
+_CACHE_DIR = Path.home() / '.cache' / 'resume-retool'
+_URL_CACHE_TTL = 3600  # seconds; job postings change, files are content-addressed
+
+# Patterns are compiled once at import instead of on every call
+_WHITESPACE_RE = re.compile(r'\s+')
+_SUFFIX_RE = re.compile(r'\s+(Inc|LLC|Ltd|Corp|Corporation)\.?$')
+
+# Company/position patterns in priority order; each is searched over the
+# whole text in turn, so a label anywhere beats an earlier heuristic match
+_COMPANY_PATTERNS = tuple(re.compile(p) for p in (
+    r'(?:Company|Employer|Organization)[\s:]+([A-Z][A-Za-z\s&,]+)',
+    r'About\s+([A-Z][A-Za-z\s&,]+)',
+    r'Join\s+([A-Z][A-Za-z\s&,]+)',
+    r'([A-Z][A-Za-z\s&,]+)\s+is\s+(?:seeking|hiring|looking)',
+))
+
+_POSITION_PATTERNS = tuple(re.compile(p, re.MULTILINE) for p in (
+    r'(?:Position|Title|Role)[\s:]+([A-Za-z\s,\-]+)',
+    r'(?:Job\s+Title)[\s:]+([A-Za-z\s,\-]+)',
+    r'^([A-Z][A-Za-z\s,\-]+)(?:\n|$)',  # Often first line
+    r'(?:Seeking|Hiring)\s+(?:a\s+)?([A-Z][A-Za-z\s,\-]+)',
+))
+
+# Common OCR character confusions. Zero/O is deliberately not fixed:
+# it would corrupt salaries, dates and other numbers
+_OCR_TRANS = str.maketrans({
+    '|': 'I',  # Pipe often confused with I
+    '§': 'S',  # Section symbol confused with S
+})
+
+# LSTM engine, single uniform block of text
+_TESSERACT_CONFIG = '--oem 1 --psm 6'
+
+# LinkedIn CSS selectors (class-substring matches)
+_LINKEDIN_DESCRIPTION = 'div.description__text'
+_LINKEDIN_DESCRIPTION_FALLBACK = 'div[class*="job-description"]'
+_LINKEDIN_COMPANY = 'a[class*="company-name"]'
+_LINKEDIN_TITLE = 'h1[class*="job-title"]'
+
+def _otsu(gray: np.ndarray) -> int:
+    """Otsu's threshold for an 8-bit grayscale image"""
+    hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    levels = np.arange(256)
+    
+    # Class weights and means for every candidate threshold at once
+    weight_bg = np.cumsum(hist)
+    weight_fg = weight_bg[-1] - weight_bg
+    sum_bg = np.cumsum(hist * levels)
+    mean_bg = sum_bg / np.maximum(weight_bg, 1)
+    mean_fg = (sum_bg[-1] - sum_bg) / np.maximum(weight_fg, 1)
+    
+    between_variance = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+    return int(np.argmax(between_variance))
+
+def _binarize(image: Image.Image) -> Image.Image:
+    """Convert to black-and-white so Tesseract can skip its own binarization"""
+    gray = np.asarray(image.convert('L'))
+    threshold = _otsu(gray)
+    return Image.fromarray((gray > threshold).astype(np.uint8) * 255, 'L')
+
+def _pdf_text(pdf) -> Tuple[str, str]:
+    """
+    Text of a PDF given as a file path or raw bytes
+    Returns (text, extraction_method)
+    """
+    try:
+        # PyMuPDF decodes pages natively, ~10x faster than PyPDF2
+        if isinstance(pdf, bytes):
+            doc = fitz.open(stream=pdf, filetype='pdf')
+        else:
+            doc = fitz.open(pdf)
+        with doc:
+            return "\n".join(page.get_text() for page in doc), 'PyMuPDF'
+    except Exception:
+        # Fall back to PyPDF2 if PyMuPDF is missing or chokes on the file
+        reader = PyPDF2.PdfReader(io.BytesIO(pdf) if isinstance(pdf, bytes) else pdf)
+        return "".join(page.extract_text() or '' for page in reader.pages), 'PyPDF2'
+
+def _cache_path(namespace: str, key: bytes) -> Path:
+    """Location of a cache entry, keyed by the SHA-256 of key"""
+    return _CACHE_DIR / namespace / hashlib.sha256(key).hexdigest()
+
+def _cache_get(namespace: str, key: bytes, ttl: Optional[float] = None) -> Optional[bytes]:
+    """Read a cache entry, or None if it is missing or older than ttl"""
+    path = _cache_path(namespace, key)
+    try:
+        if ttl is not None and time.time() - path.stat().st_mtime > ttl:
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+def _cache_set(namespace: str, key: bytes, value: bytes):
+    """Write a cache entry atomically; caching is best-effort"""
+    path = _cache_path(namespace, key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_bytes(value)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+def _ocr_one(image_path: str) -> str:
+    """OCR a single image (module-level so worker processes can pickle it)"""
+    image = _binarize(Image.open(image_path))
+    return pytesseract.image_to_string(image, config=_TESSERACT_CONFIG)
+
 class JobPostingExtractor:
     """
     Extracts job posting text from various sources
     Supports: Screenshots, URLs, PDFs, and raw text
     """
     
-    def __init__(self):
+    # Job boards with a dedicated parser; everything else (including
+    # Indeed and Glassdoor for now) goes through _parse_generic
+    _DOMAIN_PARSERS = (
+        ('linkedin.com', '_parse_linkedin'),
+    )
+    
+    def __init__(self, use_cache: bool = True):
+        # Reuse fetched pages / extracted file text across runs
+        self.use_cache = use_cache
         self.supported_formats = {
             'screenshot': ['.png', '.jpg', '.jpeg', '.gif', '.bmp'],
             'pdf': ['.pdf'],
             'text': ['.txt', '.md'],
             'url': ['http://', 'https://']
         }
+        
+        # One pooled HTTP/2 client, so repeat requests to a job board reuse
+        # the TCP/TLS connection (httpx negotiates gzip by default)
+        self._http = httpx.Client(
+            http2=True,
+            follow_redirects=True,
+            headers=_HEADERS,
+            timeout=_HTTP_TIMEOUT
+        )
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close pooled HTTP connections"""
+        self._http.close()
     
     def extract_from_source(self, source: str) -> Dict:
         """
@@ -53,13 +208,7 @@ class JobPostingExtractor:
             if self._is_url(source):
                 result = self._extract_from_url(source)
             elif os.path.isfile(source):
-                ext = os.path.splitext(source)[1].lower()
-                if ext in self.supported_formats['screenshot']:
-                    result = self._extract_from_screenshot(source)
-                elif ext in self.supported_formats['pdf']:
-                    result = self._extract_from_pdf(source)
-                elif ext in self.supported_formats['text']:
-                    result = self._extract_from_text_file(source)
+                result = self._extract_from_file(source) or result
             else:
                 # Assume it's raw text
                 result = self._extract_from_text(source)
@@ -75,59 +224,192 @@ class JobPostingExtractor:
         
         return result
     
-    def _is_url(self, source: str) -> bool:
-        """Check if source is a URL"""
-        return source.startswith('http://') or source.startswith('https://')
+    async def extract_from_sources(self, sources: List[str], max_concurrency: int = 10) -> List[Dict]:
+        """
+        Batch entry point - extracts many sources concurrently
+        
+        URL fetches share one HTTP/2 client and run in parallel (bounded by
+        max_concurrency), so N postings cost roughly one round-trip instead
+        of N. Files and raw text go through the regular sync path.
+        
+        Args:
+            sources: File paths, URLs, or raw text
+            max_concurrency: Maximum number of in-flight HTTP requests
+            
+        Returns:
+            List of result dicts, in the same order as sources
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+        async with httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            headers=_HEADERS,
+            timeout=_HTTP_TIMEOUT
+        ) as client:
+            return await asyncio.gather(
+                *[self._afetch_and_parse(client, source, sem) for source in sources]
+            )
     
-    def _extract_from_screenshot(self, image_path: str) -> Dict:
-        """Extract text from screenshot using OCR"""
-        print(f"📸 Extracting text from screenshot: {image_path}")
+    async def _afetch(self, client: httpx.AsyncClient, url: str) -> bytes:
+        """Fetch a URL body asynchronously, served from the cache when fresh"""
+        cached = self._cached_body(url)
+        if cached is not None:
+            return cached
+        
+        response = await client.get(url)
+        self._store_body(url, response)
+        return response.content
+    
+    async def _afetch_and_parse(self, client: httpx.AsyncClient, source: str,
+                                sem: asyncio.Semaphore) -> Dict:
+        """Fetch and parse a single source for extract_from_sources"""
+        if not self._is_url(source):
+            return await asyncio.to_thread(self.extract_from_source, source)
         
+        print(f"🌐 Extracting job posting from URL: {source}")
         try:
-            # Open image
-            image = Image.open(image_path)
-            
-            # Use Tesseract OCR to extract text
-            text = pytesseract.image_to_string(image)
+            async with sem:
+                html = await self._afetch(client, source)
             
-            # Clean up OCR output
-            text = self._clean_ocr_text(text)
+            result = self._parse_page(source, html)
             
-            return {
-                'job_text': text,
-                'source_type': 'screenshot',
-                'extraction_method': 'OCR (Tesseract)',
-                'success': True,
-                'error': None
-            }
+            if result['success']:
+                result['company'] = self._extract_company(result['job_text'])
+                result['position'] = self._extract_position(result['job_text'])
+            return result
             
         except Exception as e:
             return {
                 'job_text': '',
-                'source_type': 'screenshot',
-                'extraction_method': 'OCR (Tesseract)',
+                'source_type': 'url',
+                'extraction_method': 'web_scraping',
+                'company': '',
+                'position': '',
                 'success': False,
-                'error': f"OCR extraction failed: {str(e)}"
+                'error': f"URL extraction failed: {str(e)}"
             }
     
+    def _extract_from_file(self, file_path: str) -> Optional[Dict]:
+        """Extract from a local file, reusing cached text for identical content"""
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext in self.supported_formats['screenshot']:
+            extract = self._extract_from_screenshot
+        elif ext in self.supported_formats['pdf']:
+            extract = self._extract_from_pdf
+        elif ext in self.supported_formats['text']:
+            extract = self._extract_from_text_file
+        else:
+            return None
+        
+        if not self.use_cache:
+            return extract(file_path)
+        
+        # Key on the file contents, so renamed copies hit and edits miss
+        with open(file_path, 'rb') as f:
+            key = ext.encode() + f.read()
+        
+        cached = _cache_get('files', key)
+        if cached is not None:
+            return json.loads(cached)
+        
+        result = extract(file_path)
+        if result['success']:
+            _cache_set('files', key, json.dumps(result).encode())
+        return result
+    
+    def _fetch(self, url: str) -> bytes:
+        """Fetch a URL body, served from the cache when fresh"""
+        cached = self._cached_body(url)
+        if cached is not None:
+            return cached
+        
+        response = self._http.get(url)
+        self._store_body(url, response)
+        return response.content
+    
+    def _cached_body(self, url: str) -> Optional[bytes]:
+        """Return the cached body for url, or None when caching is off or it is stale"""
+        if not self.use_cache:
+            return None
+        return _cache_get('http', url.encode(), ttl=_URL_CACHE_TTL)
+    
+    def _store_body(self, url: str, response: httpx.Response) -> None:
+        """Cache a successful response body for url"""
+        if self.use_cache and response.is_success:
+            _cache_set('http', url.encode(), response.content)
+    
+    def _is_url(self, source: str) -> bool:
+        """Check if source is a URL"""
+        return source.startswith(('http://', 'https://'))
+    
+    def extract_from_screenshots(self, image_paths: List[str], workers: Optional[int] = None) -> List[Dict]:
+        """
+        Batch OCR for many screenshots, sharded across CPU cores
+        
+        Tesseract is CPU-bound, so each image runs in a worker process;
+        throughput scales close to linearly with physical cores. OCR stays
+        on the CPU: Tesseract's OpenCL offload usually regresses.
+        
+        Args:
+            image_paths: Screenshot file paths
+            workers: Number of worker processes (default: CPU count)
+            
+        Returns:
+            List of result dicts, in the same order as image_paths
+        """
+        results = []
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            futures = [executor.submit(_ocr_one, path) for path in image_paths]
+            for future in futures:
+                try:
+                    result = self._screenshot_result(future.result())
+                except Exception as e:
+                    result = self._screenshot_error(e)
+                
+                if result['success']:
+                    result['company'] = self._extract_company(result['job_text'])
+                    result['position'] = self._extract_position(result['job_text'])
+                results.append(result)
+        
+        return results
+    
+    def _extract_from_screenshot(self, image_path: str) -> Dict:
+        """Extract text from screenshot using OCR"""
+        print(f"📸 Extracting text from screenshot: {image_path}")
+        
+        try:
+            return self._screenshot_result(_ocr_one(image_path))
+        except Exception as e:
+            return self._screenshot_error(e)
+    
+    def _screenshot_result(self, text: str) -> Dict:
+        """Build the result for raw OCR output"""
+        return {
+            'job_text': self._clean_ocr_text(text),
+            'source_type': 'screenshot',
+            'extraction_method': 'OCR (Tesseract)',
+            'success': True,
+            'error': None
+        }
+    
+    def _screenshot_error(self, error: Exception) -> Dict:
+        """Build the result for a failed OCR run"""
+        return {
+            'job_text': '',
+            'source_type': 'screenshot',
+            'extraction_method': 'OCR (Tesseract)',
+            'success': False,
+            'error': f"OCR extraction failed: {str(error)}"
+        }
+    
     def _extract_from_url(self, url: str) -> Dict:
         """Extract job posting from URL"""
         print(f"🌐 Extracting job posting from URL: {url}")
         
         try:
             # Detect job board and use appropriate extraction
-            domain = urlparse(url).netloc
+            return self._parse_page(url, self._fetch(url))
             
-            if 'linkedin.com' in domain:
-                return self._extract_from_linkedin(url)
-            elif 'indeed.com' in domain:
-                return self._extract_from_indeed(url)
-            elif 'glassdoor.com' in domain:
-                return self._extract_from_glassdoor(url)
-            else:
-                # Generic extraction
-                return self._extract_generic_webpage(url)
-                
         except Exception as e:
             return {
                 'job_text': '',
@@ -137,22 +419,37 @@ class JobPostingExtractor:
                 'error': f"URL extraction failed: {str(e)}"
             }
     
-    def _extract_from_linkedin(self, url: str) -> Dict:
-        """Extract from LinkedIn job posting"""
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+    def _parse_page(self, url: str, body: bytes) -> Dict:
+        """Parse a fetched URL body with the matching parser"""
+        # Sniff the body rather than Content-Type so cached bodies work too;
+        # linked PDFs are read in memory without a temp file
+        if body.startswith(b'%PDF'):
+            return self._parse_pdf_bytes(body)
+        return self._parser_for(url)(body)
+    
+    def _parser_for(self, url: str):
+        """Pick the page parser for a URL's job board"""
+        host = urlparse(url).hostname or ''
+        for domain, parser in self._DOMAIN_PARSERS:
+            # Match the domain or its subdomains, not arbitrary substrings
+            if host == domain or host.endswith('.' + domain):
+                return getattr(self, parser)
         
-        response = requests.get(url, headers=headers)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Generic extraction
+        return self._parse_generic
+    
+    def _parse_linkedin(self, html: bytes) -> Dict:
+        """Parse a fetched LinkedIn job posting"""
+        soup = BeautifulSoup(html, 'lxml')
         
         # LinkedIn-specific selectors
         job_text = ""
         
         # Try to find job description section
-        description_section = soup.find('div', class_='description__text')
-        if not description_section:
-            description_section = soup.find('div', {'class': re.compile('job-description')})
+        description_section = (
+            soup.select_one(_LINKEDIN_DESCRIPTION)
+            or soup.select_one(_LINKEDIN_DESCRIPTION_FALLBACK)
+        )
         
         if description_section:
             job_text = description_section.get_text(separator='\n', strip=True)
@@ -161,11 +458,11 @@ class JobPostingExtractor:
         company = ""
         position = ""
         
-        company_elem = soup.find('a', {'class': re.compile('company-name')})
+        company_elem = soup.select_one(_LINKEDIN_COMPANY)
         if company_elem:
             company = company_elem.get_text(strip=True)
         
-        title_elem = soup.find('h1', {'class': re.compile('job-title')})
+        title_elem = soup.select_one(_LINKEDIN_TITLE)
         if title_elem:
             position = title_elem.get_text(strip=True)
         
@@ -179,25 +476,23 @@ class JobPostingExtractor:
             'error': None if job_text else "Could not extract job description"
         }
     
-    def _extract_generic_webpage(self, url: str) -> Dict:
-        """Generic webpage extraction"""
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.get(url, headers=headers)
-        soup = BeautifulSoup(response.content, 'html.parser')
+    def _parse_generic(self, html: bytes) -> Dict:
+        """Parse a fetched generic webpage"""
+        # Parse straight into lxml; no BeautifulSoup object graph needed
+        tree = lxml.html.fromstring(html)
         
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+        # Remove script, style and comment nodes
+        for node in tree.xpath('//script|//style|//noscript|//comment()'):
+            node.drop_tree()
         
-        # Get text
-        text = soup.get_text(separator='\n', strip=True)
-        
-        # Clean up text
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-        text = '\n'.join(lines)
+        # Get text, one stripped non-empty line per output line, in a single
+        # generator pass (no intermediate list or joined string)
+        lines = (
+            line.strip()
+            for part in tree.itertext()
+            for line in part.splitlines()
+        )
+        text = '\n'.join(line for line in lines if line)
         
         return {
             'job_text': text,
@@ -210,19 +505,20 @@ class JobPostingExtractor:
     def _extract_from_pdf(self, pdf_path: str) -> Dict:
         """Extract text from PDF"""
         print(f"📄 Extracting text from PDF: {pdf_path}")
-        
+        return self._pdf_result(pdf_path, 'pdf')
+    
+    def _parse_pdf_bytes(self, content: bytes) -> Dict:
+        """Parse a PDF fetched from a URL, in memory"""
+        return self._pdf_result(content, 'url')
+    
+    def _pdf_result(self, pdf, source_type: str) -> Dict:
+        """Build the result for a PDF given as a path or raw bytes"""
         try:
-            text = ""
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text()
-            
+            text, method = _pdf_text(pdf)
             return {
                 'job_text': text,
-                'source_type': 'pdf',
-                'extraction_method': 'PyPDF2',
+                'source_type': source_type,
+                'extraction_method': method,
                 'success': True,
                 'error': None
             }
@@ -230,7 +526,7 @@ class JobPostingExtractor:
         except Exception as e:
             return {
                 'job_text': '',
-                'source_type': 'pdf',
+                'source_type': source_type,
                 'extraction_method': 'PyPDF2',
                 'success': False,
                 'error': f"PDF extraction failed: {str(e)}"
@@ -261,59 +557,54 @@ class JobPostingExtractor:
     
     def _clean_ocr_text(self, text: str) -> str:
         """Clean up OCR output"""
-        # Fix common OCR errors
-        replacements = {
-            '|': 'I',  # Pipe often confused with I
-            '0': 'O',  # Zero/O confusion in certain contexts
-            '§': 'S',  # Section symbol confused with S
-        }
+        # Fix common OCR errors in a single character pass
+        text = text.translate(_OCR_TRANS)
         
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Fix line breaks
-        text = re.sub(r'(?<=[a-z])\s+(?=[a-z])', ' ', text)
+        # Remove excessive whitespace (also joins broken lines)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         return text.strip()
     
     def _extract_company(self, text: str) -> str:
-        """Try to extract company name from job text"""
-        patterns = [
-            r'(?:Company|Employer|Organization)[\s:]+([A-Z][A-Za-z\s&,]+)',
-            r'About\s+([A-Z][A-Za-z\s&,]+)',
-            r'Join\s+([A-Z][A-Za-z\s&,]+)',
-            r'([A-Z][A-Za-z\s&,]+)\s+is\s+(?:seeking|hiring|looking)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        """
+        Try to extract company name from job text
+        
+        A labelled company wins over an earlier heuristic match:
+        
+        >>> extractor = JobPostingExtractor.__new__(JobPostingExtractor)  # no HTTP client
+        >>> extractor._extract_company("About Us\\nCompany: Acme Corp\\n")
+        'Acme'
+        """
+        for pattern in _COMPANY_PATTERNS:
+            match = pattern.search(text)
             if match:
-                company = match.group(1).strip()
-                # Clean up common suffixes
-                company = re.sub(r'\s+(Inc|LLC|Ltd|Corp|Corporation)\.?$', '', company)
-                return company
+                return self._clean_company(match.group(1))
         
         return ""
     
+    def _clean_company(self, company: str) -> str:
+        """Normalize a company name candidate"""
+        # Clean up common suffixes
+        return _SUFFIX_RE.sub('', company.strip())
+    
     def _extract_position(self, text: str) -> str:
         """Try to extract position title from job text"""
-        patterns = [
-            r'(?:Position|Title|Role)[\s:]+([A-Za-z\s,\-]+)',
-            r'(?:Job\s+Title)[\s:]+([A-Za-z\s,\-]+)',
-            r'^([A-Z][A-Za-z\s,\-]+)(?:\n|$)',  # Often first line
-            r'(?:Seeking|Hiring)\s+(?:a\s+)?([A-Z][A-Za-z\s,\-]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.MULTILINE)
+        for pattern in _POSITION_PATTERNS:
+            match = pattern.search(text)
             if match:
-                position = match.group(1).strip()
-                # Remove common artifacts
-                position = position.replace('\n', ' ').strip()
-                if len(position) > 5 and len(position) < 100:  # Sanity check
+                position = self._clean_position(match.group(1))
+                if position:
                     return position
         
         return ""
+    
+    def _clean_position(self, position: str) -> str:
+        """Normalize a position candidate, or '' if it fails the sanity check"""
+        # Remove common artifacts
+        position = position.strip().replace('\n', ' ').strip()
+        if len(position) > 5 and len(position) < 100:  # Sanity check
+            return position
+        return ''
 
 # Example usage
 if __name__ == "__main__":
@@ -4,13 +4,118 @@ Keyword Optimization Engine for Resume Retool
 This module ensures 100% factual accuracy while maximizing keyword matches
 """
 
+import functools
 import re
 import json
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 from collections import Counter
-import spacy
 from dataclasses import dataclass
 
+# Patterns are compiled once at import instead of on every call
+_REQUIRED_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'required[\s\S]*?(?=preferred|desired|responsibilities|$)',
+    r'must have[\s\S]*?(?=nice to have|preferred|$)',
+    r'qualifications[\s\S]*?(?=preferred|responsibilities|$)'
+]]
+_BULLET_RE = re.compile(r'[•\-\*]\s*([^•\-\*\n]+)')
+
+# Map of safe replacements (things the user actually did)
+_SAFE_REPLACEMENTS = {
+    'managed': 'strategically led',
+    'oversaw': 'drove enterprise-wide',
+    'led': 'spearheaded',
+    'improved': 'transformed',
+    'created': 'designed and implemented',
+    'worked with': 'partnered with',
+    'helped': 'enabled',
+    'supported': 'facilitated'
+}
+# One alternation scans each bullet once; a single left-to-right pass
+# can't revisit replaced text (e.g. 'managed' -> 'strategically led' is
+# never rewritten again by the 'led' rule)
+_SAFE_REPLACE_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, _SAFE_REPLACEMENTS)) + r')\b',
+    re.IGNORECASE
+)
+
+
+def _safe_replacement(match: re.Match) -> str:
+    return _SAFE_REPLACEMENTS[match.group(0).lower()]
+
+# Action verbs that mark a sentence as a responsibility; matched as
+# substrings (so 'leads', 'managed' count), one scan per sentence
+_ACTION_VERBS = [
+    'lead', 'manage', 'develop', 'implement', 'oversee', 'drive',
+    'coordinate', 'collaborate', 'design', 'execute', 'monitor'
+]
+_ACTION_VERB_RE = re.compile('|'.join(map(re.escape, _ACTION_VERBS)))
+
+# Industry-specific terms (for Centene example)
+_HEALTHCARE_TERMS = [
+    'healthcare', 'health care', 'medicaid', 'medicare', 'duals',
+    'health plan', 'managed care', 'clinical', 'regulatory', 'CMS'
+]
+
+def _compile_terms(terms) -> re.Pattern:
+    """Compile a term dictionary into one case-insensitive alternation"""
+    # Longest first so overlapping terms prefer the most specific match
+    ordered = sorted(terms, key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, ordered)), re.IGNORECASE)
+
+_HEALTHCARE_RE = _compile_terms(_HEALTHCARE_TERMS)
+
+_SYNONYM_MAP = {
+    'manage': ['lead', 'oversee', 'direct', 'supervise'],
+    'implement': ['execute', 'deploy', 'deliver', 'launch'],
+    'strategy': ['strategic', 'planning', 'roadmap'],
+    'stakeholder': ['client', 'partner', 'executive', 'leadership'],
+    'process': ['workflow', 'procedure', 'framework'],
+    'transform': ['change', 'modernize', 'improve', 'optimize']
+}
+
+def _build_synonym_index() -> Dict[str, Tuple[str, ...]]:
+    """Map every word in _SYNONYM_MAP (key or value) to the rest of its group"""
+    index = {}
+    for key, values in _SYNONYM_MAP.items():
+        group = [key, *values]
+        for word in group:
+            # Dicts keep first-seen order, so lookups stay deterministic
+            index.setdefault(word, {}).update(dict.fromkeys(w for w in group if w != word))
+    return {word: tuple(synonyms) for word, synonyms in index.items()}
+
+_SYNONYM_INDEX = _build_synonym_index()
+
+# Report keywords repeat across categories and case/whitespace variants,
+# so the per-keyword lookups below are memoized
+
+@functools.lru_cache(maxsize=4096)
+def _lookup_synonyms(keyword: str) -> Tuple[str, ...]:
+    """Synonyms for a keyword, from the index or a base-word fallback"""
+    synonyms = _SYNONYM_INDEX.get(keyword)
+    if synonyms is not None:
+        return synonyms
+    
+    # Fall back to base words inside a longer phrase ('manage teams')
+    return tuple(
+        synonym
+        for key, values in _SYNONYM_MAP.items() if key in keyword
+        for synonym in values
+    )
+
+@functools.lru_cache(maxsize=4096)
+def _pattern_matches(pattern: re.Pattern, text: str) -> bool:
+    """Cached pattern.search(text) is not None"""
+    return pattern.search(text) is not None
+
+@functools.lru_cache(maxsize=1)
+def _get_nlp():
+    """
+    Load the spaCy pipeline once, on first use
+    Only the tokenizer/tagger are kept; batch texts with nlp.pipe()
+    """
+    import spacy
+    return spacy.load("en_core_web_sm", disable=["parser", "ner", "lemmatizer"])
+
 @dataclass
 class KeywordMatch:
     """Represents a keyword match between job and resume"""
@@ -32,7 +137,14 @@ class KeywordOptimizer:
     def __init__(self, user_resume_data: Dict):
         """Initialize with user's base resume data"""
         self.user_data = user_resume_data
-        self.experience_keywords = self._extract_resume_keywords()
+        
+        # All legitimate keywords from user's experience bullets and skills
+        self.experience_keywords = frozenset(
+            word
+            for exp in user_resume_data.get('experience', ())
+            for bullet in exp.get('bullets', ())
+            for word in bullet.lower().split()
+        ) | frozenset(skill.lower() for skill in user_resume_data.get('skills', ()))
 
         # User's actual experience domains (NEVER fabricate outside these)
         self.verified_domains = {
@@ -69,24 +181,30 @@ class KeywordOptimizer:
             'technical_deep': ['software engineering', 'coding', 'programming', 'developer'],
             'specific_certs': ['PMP', 'Six Sigma', 'ITIL', 'Scrum Master'] # unless verified
         }
-
-    def _extract_resume_keywords(self) -> Set[str]:
-        """Extract all legitimate keywords from user's experience"""
-        keywords = set()
-
-        # Extract from experience bullets
-        for exp in self.user_data.get('experience', []):
-            for bullet in exp.get('bullets', []):
-                # Extract noun phrases and action verbs
-                words = bullet.lower().split()
-                keywords.update(words)
-
-        # Extract from skills
-        for skill in self.user_data.get('skills', []):
-            keywords.add(skill.lower())
         
-        return keywords
-    
+        # Each dictionary is scanned in a single pass instead of a nested
+        # `term in keyword` loop per lookup
+        self._forbidden_re = _compile_terms(
+            term for terms in self.forbidden_keywords.values() for term in terms
+        )
+        self._verified_terms = [
+            term for terms in self.verified_domains.values() for term in terms
+        ]
+        # Zero-width lookahead so finditer reports the longest term starting
+        # at every position, overlapping ones included
+        self._verified_re = re.compile(
+            f'(?=({_compile_terms(self._verified_terms).pattern}))', re.IGNORECASE
+        )
+        # Any term found inside a keyword brings every term it contains, so
+        # map each term to the first (in list order) term contained in it
+        lowered = [term.lower() for term in self._verified_terms]
+        self._verified_first_within = {
+            term: next(i for i, other in enumerate(lowered) if other in term)
+            for term in lowered
+        }
+        # NUL-separated so a keyword can never match across two terms
+        self._verified_blob = '\0'.join(term.lower() for term in self._verified_terms)
+
     def extract_job_keywords(self, job_text: str) -> Dict[str, List[str]]:
         """
         Extract and categorize keywords from job posting
@@ -103,42 +221,27 @@ class KeywordOptimizer:
         }
         
         # Pattern matching for requirements sections
-        required_patterns = [
-            r'required[\s\S]*?(?=preferred|desired|responsibilities|$)',
-            r'must have[\s\S]*?(?=nice to have|preferred|$)',
-            r'qualifications[\s\S]*?(?=preferred|responsibilities|$)'
-        ]
-        
-        for pattern in required_patterns:
-            matches = re.findall(pattern, job_lower, re.IGNORECASE)
+        for pattern in _REQUIRED_PATTERNS:
+            matches = pattern.findall(job_lower)
             for match in matches:
                 # Extract bullet points or comma-separated items
-                items = re.findall(r'[•\-\*]\s*([^•\-\*\n]+)', match)
+                items = _BULLET_RE.findall(match)
                 keywords['required_skills'].extend(items)
         
-        # Extract action verbs (responsibilities)
-        action_verbs = [
-            'lead', 'manage', 'develop', 'implement', 'oversee', 'drive',
-            'coordinate', 'collaborate', 'design', 'execute', 'monitor'
+        # Extract action verbs (responsibilities); lowercasing never adds or
+        # drops a '.', so the lowered sentences line up with the originals
+        keywords['responsibilities'] = [
+            sentence.strip()
+            for sentence, sentence_lower in zip(job_text.split('.'), job_lower.split('.'))
+            if _ACTION_VERB_RE.search(sentence_lower)
         ]
         
-        sentences = job_text.split('.')
-        for sentence in sentences:
-            for verb in action_verbs:
-                if verb in sentence.lower():
-                    keywords['responsibilities'].append(sentence.strip())
-                    break
-        
-        # Industry-specific terms (for Centene example)
-        healthcare_terms = [
-            'healthcare', 'health care', 'medicaid', 'medicare', 'duals',
-            'health plan', 'managed care', 'clinical', 'regulatory', 'CMS'
+        # Industry-specific terms
+        found = {m.group(0) for m in _HEALTHCARE_RE.finditer(job_lower)}
+        keywords['industry_specific'] = [
+            term for term in _HEALTHCARE_TERMS if term.lower() in found
         ]
         
-        for term in healthcare_terms:
-            if term in job_lower:
-                keywords['industry_specific'].append(term)
-        
         return keywords
     
     def match_keywords_to_experience(self, job_keywords: Dict) -> List[KeywordMatch]:
@@ -165,11 +268,25 @@ class KeywordOptimizer:
     
     def _is_forbidden(self, keyword: str) -> bool:
         """Check if keyword is something user cannot claim"""
-        for category, forbidden_list in self.forbidden_keywords.items():
-            for forbidden in forbidden_list:
-                if forbidden in keyword:
-                    return True
-        return False
+        return _pattern_matches(self._forbidden_re, keyword)
+    
+    def _find_verified_term(self, keyword: str) -> Optional[str]:
+        """Find a verified domain term that contains or is contained in keyword"""
+        candidates = []
+        
+        # Keyword inside a verified term
+        pos = self._verified_blob.find(keyword)
+        if pos != -1:
+            candidates.append(self._verified_blob.count('\0', 0, pos))
+        
+        # Verified terms inside the keyword; a shorter term sharing a start
+        # position is a prefix of the reported one, so it is covered too
+        candidates.extend(
+            self._verified_first_within[match.group(1).lower()]
+            for match in self._verified_re.finditer(keyword)
+        )
+        
+        return self._verified_terms[min(candidates)] if candidates else None
     
     def _find_experience_match(self, keyword: str) -> Optional[KeywordMatch]:
         """Find matching experience for a keyword"""
@@ -185,16 +302,15 @@ class KeywordOptimizer:
             )
         
         # Check for related/transferable skills
-        for domain, domain_keywords in self.verified_domains.items():
-            for verified_keyword in domain_keywords:
-                if keyword in verified_keyword or verified_keyword in keyword:
-                    return KeywordMatch(
-                        keyword=keyword,
-                        job_context="Required in job posting",
-                        resume_context=f"Related experience: {verified_keyword}",
-                        match_type="related",
-                        confidence=0.8
-                    )
+        verified_keyword = self._find_verified_term(keyword)
+        if verified_keyword:
+            return KeywordMatch(
+                keyword=keyword,
+                job_context="Required in job posting",
+                resume_context=f"Related experience: {verified_keyword}",
+                match_type="related",
+                confidence=0.8
+            )
         
         # Check for synonyms/variations
         synonyms = self._get_synonyms(keyword)
@@ -210,55 +326,17 @@ class KeywordOptimizer:
         
         return None
     
-    def _get_synonyms(self, keyword: str) -> List[str]:
+    def _get_synonyms(self, keyword: str) -> Tuple[str, ...]:
         """Get synonyms for keyword matching"""
-        synonym_map = {
-            'manage': ['lead', 'oversee', 'direct', 'supervise'],
-            'implement': ['execute', 'deploy', 'deliver', 'launch'],
-            'strategy': ['strategic', 'planning', 'roadmap'],
-            'stakeholder': ['client', 'partner', 'executive', 'leadership'],
-            'process': ['workflow', 'procedure', 'framework'],
-            'transform': ['change', 'modernize', 'improve', 'optimize']
-        }
-        
-        synonyms = []
-        for key, values in synonym_map.items():
-            if key in keyword:
-                synonyms.extend(values)
-            elif keyword in values:
-                synonyms.append(key)
-                synonyms.extend([v for v in values if v != keyword])
-        
-        return synonyms
+        return _lookup_synonyms(keyword)
     
     def rewrite_bullet_with_keywords(self, original_bullet: str, keywords: List[str]) -> str:
         """
         Rewrite a resume bullet to include keywords
         CRITICAL: Only reword, never add new claims
         """
-        rewritten = original_bullet
-        
-        # Map of safe replacements (things Nana actually did)
-        safe_replacements = {
-            'managed': 'strategically led',
-            'oversaw': 'drove enterprise-wide',
-            'led': 'spearheaded',
-            'improved': 'transformed',
-            'created': 'designed and implemented',
-            'worked with': 'partnered with',
-            'helped': 'enabled',
-            'supported': 'facilitated'
-        }
-        
-        for old, new in safe_replacements.items():
-            if old in rewritten.lower() and new not in rewritten.lower():
-                # Only replace if it maintains truthfulness
-                rewritten = re.sub(
-                    rf'\b{old}\b', 
-                    new, 
-                    rewritten, 
-                    flags=re.IGNORECASE
-                )
+        # Only reword with replacements that maintain truthfulness
+        rewritten = _SAFE_REPLACE_RE.sub(_safe_replacement, original_bullet)
         
         # Add industry context if applicable (but only if true)
         # Example: if 'healthcare' in keywords and 'Consulting' in original_bullet:
@@ -269,6 +347,11 @@ class KeywordOptimizer:
         
         return rewritten
     
+    def rewrite_bullets_with_keywords(self, bullets: List[str], keywords: List[str]) -> List[str]:
+        """Rewrite a batch of bullets; same rules as rewrite_bullet_with_keywords"""
+        sub = _SAFE_REPLACE_RE.sub
+        return [sub(_safe_replacement, bullet) for bullet in bullets]
+    
     def generate_keyword_report(self, job_text: str) -> Dict:
         """
         Generate a report showing:
@@ -280,10 +363,19 @@ class KeywordOptimizer:
         job_keywords = self.extract_job_keywords(job_text)
         matches = self.match_keywords_to_experience(job_keywords)
         
+        # Count and normalize every keyword in one pass; duplicates collapse
+        # to the first spelling
+        total = 0
+        normalized = {}
+        for keywords in job_keywords.values():
+            total += len(keywords)
+            for keyword in keywords:
+                normalized.setdefault(keyword.lower().strip(), keyword)
+        
         report = {
-            'total_keywords': sum(len(v) for v in job_keywords.values()),
+            'total_keywords': total,
             'matched_keywords': len(matches),
-            'match_rate': len(matches) / max(1, sum(len(v) for v in job_keywords.values())),
+            'match_rate': len(matches) / max(1, total),
             'matched_details': [
                 {
                     'keyword': m.keyword,
@@ -292,28 +384,30 @@ class KeywordOptimizer:
                 }
                 for m in matches
             ],
-            'unmatched_keywords': [],
-            'optimization_suggestions': []
         }
         
-        # Find unmatched keywords
+        # Split unmatched keywords into ones we cannot claim and ones to reposition
         matched_words = {m.keyword for m in matches}
-        for category, keywords in job_keywords.items():
-            for keyword in keywords:
-                if keyword.lower().strip() not in matched_words:
-                    if not self._is_forbidden(keyword.lower()):
-                        # Look for partial matches or transferable skills
-                        suggestion = self._suggest_alternative(keyword)
-                        if suggestion:
-                            report['optimization_suggestions'].append({
-                                'missing': keyword,
-                                'alternative': suggestion
-                            })
-                    else:
-                        report['unmatched_keywords'].append({
-                            'keyword': keyword,
-                            'reason': 'No direct experience - cannot fabricate'
-                        })
+        unmatched = [norm for norm in normalized if norm not in matched_words]
+        forbidden = {norm for norm in unmatched if self._is_forbidden(norm)}
+        
+        report['unmatched_keywords'] = [
+            {
+                'keyword': normalized[norm],
+                'reason': 'No direct experience - cannot fabricate'
+            }
+            for norm in unmatched if norm in forbidden
+        ]
+        
+        # Look for partial matches or transferable skills
+        suggestions = (
+            (normalized[norm], self._suggest_alternative(norm))
+            for norm in unmatched if norm not in forbidden
+        )
+        report['optimization_suggestions'] = [
+            {'missing': keyword, 'alternative': suggestion}
+            for keyword, suggestion in suggestions if suggestion
+        ]
         
         return report
     
@@ -4,17 +4,237 @@ Resume Retool - Main Application
 100% Factual Resume Customization with Keyword Optimization
 """
 
+import hashlib
 import json
 import os
+import re
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 import argparse
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, Optional, Sequence, Tuple
 
-from input_handler import JobPostingExtractor
-from keyword_optimizer import KeywordOptimizer
-from resume_builder import ResumeBuilder
-from pdf_generator_pro import create_professional_pdf
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# User's verified resume data (replace with your own). Built once at import
+# and shared read-only, so accidental mutation fails fast.
+_USER_BASE_DATA = MappingProxyType({
+    "full_name": "Your Name",
+    "contact": "your.email@example.com | Your Location | LinkedIn",
+    "title": "SVP, Director Integrated Delivery | Best Practices & Change Agent | Operations Guru",
+    "summary": "A highly accomplished, creative, and strategic Project Management & Business Operations Leader with 20+ years of extensive work experience",
+    "skills": (
+        "Project & Program Management",
+        "Change Management",
+        "Digital Production",
+        "Agile & Waterfall Methodology",
+        "Risk Assessment & Mitigation",
+        "Stakeholder Management",
+        "Operations Management",
+        "Vendor Management",
+        "Financial & Budget Planning",
+        "Workflow Design",
+        "Team Leadership"
+    ),
+    "experience": [
+        {
+            "company": "TBWA WH, NEW YORK, NY",
+            "dates": "2023 – Present",
+            "title": "SVP, Director of Integrated Delivery/Project + Program Management",
+            "bullets": [
+                "Build, grow, lead a department of 30 Project Managers across approx. 70 million dollar portfolio",
+                "Oversee entire P&L across projects, resource allocations, scope change/creep, etc",
+                "Improve, modernize, and digitize production, work streams, Ways of Working across the agency",
+                "Manage and optimize program performance by tracking activities, goals, targets, KPIs, and budgets",
+                "Indispensable partner across all disciplines; continuously partnering to improve and optimize delivery",
+                "PM Driver for operationalizing AI practices within PM dept, overall agency"
+            ]
+        },
+        {
+            "company": "ACCENTURE, NEW YORK, NY",
+            "dates": "2020 – 2023",
+            "title": "Marketing and Communications Brand Delivery Lead",
+            "bullets": [
+                "Led change management in a dynamic and growing start-up environment",
+                "Improved, modernized, and digitized production work streams by performing workflow and gap analysis",
+                "Developed and mentored a project management team of 8-12 members",
+                "Oversaw ~30 active projects across Health and Public Service, Comms & Media, High Tech, Banking, Insurance sectors",
+                "Led PM Department leadership and growth along with managing P&L across all projects",
+                "Promoted from NY Brand Delivery Lead to NA and Canada Brand Delivery Lead"
+            ]
+        },
+        {
+            "company": "FREELANCE",
+            "dates": "2017 – 2019",
+            "title": "Executive Producer/PMO Consultant",
+            "bullets": [
+                "Took charge of project portfolio management, initialized project management processes, and implemented project management tools and methods",
+                "Led complex projects from initiation through deployment including user adoption and change management",
+                "Worked through complex, multi-functional issues, led technical teams towards innovative and advanced solutions",
+                "Clients included: Global VW Pitch (Won), Walmart CX Transformation, Pepperidge Farm, Proactive, Merck Content Hub, Cigna, Honeywell Pitch"
+            ]
+        },
+        {
+            "company": "Y&R NY",
+            "dates": "2016 – 2017",
+            "title": "VP, Director of Project Management and Digital Operations",
+            "bullets": [
+                "Built, grew, and led the PM Department of 10 Project Managers",
+                "Oversaw entire P&L across projects, resource allocations, scope change/creep",
+                "Performed workflow and gap analysis to improve, modernize, and digitize production work streams",
+                "Managed and assessed program performance by tracking activities, goals, targets, KPIs, and budgets",
+                "Identified process improvements, innovative solutions, and new tools for broader team capacity"
+            ]
+        },
+        {
+            "company": "FREELANCE",
+            "dates": "2013 – 2016",
+            "title": "Executive Producer",
+            "bullets": [
+                "Produced audience-first, engaging storytelling through digital articles, videos, social media, push alerts, live streams",
+                "Clients: Ogilvy (UPS, Siemens), Atmosphere BBDO (Dubai Tourism), Havas Group (IBM), RAPP (NBCU, J&J, Pfizer)",
+                "Clients: Ogilvy (eTrade, Citizens Bank), Geometry/G2 (Campbell's Soup/Pepperidge Farm)"
+            ]
+        },
+        {
+            "company": "PUBLICIS KAPLAN THALER",
+            "dates": "2010 – 2013",
+            "title": "Head of Digital Production",
+            "bullets": [
+                "Oversaw business of approx. $15-$20 million and scheduling, change management, and delivery processes",
+                "Managed projects across 14 accounts including over 30 active projects for Wendy's, Merck, P&G, Napa, Champion",
+                "Hired, supervised, trained, and managed a team of 5-7 digital producers",
+                "Established and led the first Digital PM/Production Department for Kaplan Thaler Group",
+                "Awards: 2 Webbys, 4 IACs, and 1 Golden Tweet Award"
+            ]
+        }
+    ],
+    "education": [
+        {
+            "degree": "MFA, Literature, Fiction, Writing",
+            "school": "City University of New York-Brooklyn College"
+        },
+        {
+            "degree": "B.A. Degree, Literature and Creative Writing",
+            "school": "Binghamton University"
+        },
+        {
+            "degree": "B.A. Degree, German; German Philology and Literature",
+            "school": "University of Göttingen"
+        }
+    ]
+})
+
+# Characters that can't appear in (or would add directories to) a file name
+_FILENAME_TRANS = str.maketrans({c: '_' for c in ' /\\:*?"<>|\t\n'})
+
+_WORD_RE = re.compile(r'\w+')
+
+# Matched keywords that pull extra roles into the resume
+_ENTERPRISE_KEYWORDS = frozenset({'healthcare', 'health', 'enterprise', 'transformation'})
+_LEADERSHIP_KEYWORDS = frozenset({'leadership', 'executive', 'vp', 'vice president', 'director'})
+_PRODUCTION_KEYWORDS = frozenset({'digital', 'production', 'operational'})
+
+# Generated resumes kept per ResumeRetoolSystem
+_RESUME_MEMO_SIZE = 32
+
+# Large enough that a resume or job posting goes to disk in one write
+_WRITE_BUFFER = 1 << 16
+
+# Cached results for URL inputs expire like the fetched pages in
+# input_handler (_URL_CACHE_TTL); file and text inputs are content-keyed
+_URL_RESULT_TTL = 3600  # seconds
+
+def _substring_index(strings: Sequence[str]) -> Dict[str, int]:
+    """Map every substring of the given (short) strings to a bitmask of the
+    indices containing it"""
+    index = defaultdict(int)
+    for i, string in enumerate(strings):
+        bit = 1 << i
+        for start in range(len(string)):
+            for end in range(start + 1, len(string) + 1):
+                index[string[start:end]] |= bit
+    return dict(index)
+
+def _role_indices(experiences) -> Dict[str, Tuple[int, ...]]:
+    """Indices of the roles _select_relevant_experiences can add, in one pass"""
+    roles = {'y&r': [], 'publicis': [], 'freelance': []}
+    for i, exp in enumerate(experiences):
+        company = exp['company'].lower()
+        if 'y&r' in company:
+            roles['y&r'].append(i)
+        if 'publicis' in company:
+            roles['publicis'].append(i)
+        if 'freelance' in company and '2017' in exp['dates']:
+            roles['freelance'].append(i)
+    return {role: tuple(indices) for role, indices in roles.items()}
+
+def _precompute_views(data) -> MappingProxyType:
+    """Lowercased/indexed views of resume data that every report reuses"""
+    skills_lower = tuple((skill, skill.lower()) for skill in data['skills'])
+    return MappingProxyType({
+        'skills_lower': skills_lower,
+        # Skills are short phrases, so indexing every substring is cheap and
+        # turns "which skills contain this keyword" into one dict lookup
+        'skill_index': _substring_index([lower for _, lower in skills_lower]),
+        'roles': _role_indices(data['experience']),
+        # Resume text that doesn't depend on the job posting
+        'header': f"{data['full_name']}\n{data['contact']}\n\n",
+        'title_suffix': f" Candidate | {data['title']}\n\n",
+        'education': "EDUCATION\n" + "".join(
+            f"{edu['degree']} | {edu['school']}\n" for edu in data['education']
+        ),
+        'digest': hashlib.blake2b(
+            json.dumps(dict(data), sort_keys=True).encode(),
+            digest_size=16
+        ).digest(),
+    })
+
+def _jsonable(obj):
+    """Convert datetimes, paths and sets so results serialize without a default hook"""
+    if isinstance(obj, dict):
+        return {key: _jsonable(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_jsonable(value) for value in obj]
+    if isinstance(obj, (set, frozenset)):
+        return sorted((_jsonable(value) for value in obj), key=str)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Path):
+        return str(obj)
+    return obj
+
+def _write_text(path: str, text: str):
+    with open(path, 'w', buffering=_WRITE_BUFFER) as f:
+        f.write(text)
+
+def _write_json(path, data: dict, indent: bool = True):
+    """Write JSON straight to disk, via orjson when available"""
+    if orjson is not None:
+        # Non-str keys are stringified, as json.dump does
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2 if indent else None)
+
+def _read_json(path):
+    """Read JSON, via orjson when available"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+_USER_BASE_VIEWS = _precompute_views(_USER_BASE_DATA)
 
 class ResumeRetoolSystem:
     """
@@ -26,127 +246,53 @@ class ResumeRetoolSystem:
     5. Outputs ATS-optimized resume
     """
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None):
         # Load user's base resume data
         self.user_base_data = self._load_user_data()
+        if self.user_base_data is _USER_BASE_DATA:
+            self._views = _USER_BASE_VIEWS
+        else:
+            self._views = _precompute_views(self.user_base_data)
+
+        # Cached results are keyed on the input and the resume data (via its
+        # digest), so editing the resume invalidates them
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        
+        # Recently generated resumes, keyed on everything they depend on
+        self._resume_memo = OrderedDict()
 
-        # Initialize components
-        self.extractor = JobPostingExtractor()
-        self.optimizer = KeywordOptimizer(self.user_base_data)
-        self.builder = ResumeBuilder()
-        self.builder.resume_data = self.user_base_data
+        # Components are created on first use (see the properties below), so
+        # --help and cached runs skip the OCR/HTTP/NLP imports
 
         print("🚀 Resume Retool initialized")
         print("✅ 100% factual accuracy guaranteed")
 
+    @cached_property
+    def extractor(self):
+        from input_handler import JobPostingExtractor
+        return JobPostingExtractor()
+
+    @cached_property
+    def optimizer(self):
+        from keyword_optimizer import KeywordOptimizer
+        return KeywordOptimizer(self.user_base_data)
+
+    @cached_property
+    def builder(self):
+        from resume_builder import ResumeBuilder
+        builder = ResumeBuilder()
+        builder.resume_data = self.user_base_data
+        return builder
+
+    def close(self):
+        """Release the extractor's HTTP connections, if it was ever created"""
+        extractor = self.__dict__.pop('extractor', None)
+        if extractor is not None:
+            extractor.close()
+
     def _load_user_data(self) -> dict:
-        """Load user's verified resume data (replace with your own)"""
-        return {
-            "full_name": "Your Name",
-            "contact": "your.email@example.com | Your Location | LinkedIn",
-            "title": "SVP, Director Integrated Delivery | Best Practices & Change Agent | Operations Guru",
-            "summary": "A highly accomplished, creative, and strategic Project Management & Business Operations Leader with 20+ years of extensive work experience",
-            "skills": [
-                "Project & Program Management",
-                "Change Management",
-                "Digital Production",
-                "Agile & Waterfall Methodology",
-                "Risk Assessment & Mitigation",
-                "Stakeholder Management",
-                "Operations Management",
-                "Vendor Management",
-                "Financial & Budget Planning",
-                "Workflow Design",
-                "Team Leadership"
-            ],
-            "experience": [
-                {
-                    "company": "TBWA WH, NEW YORK, NY",
-                    "dates": "2023 – Present",
-                    "title": "SVP, Director of Integrated Delivery/Project + Program Management",
-                    "bullets": [
-                        "Build, grow, lead a department of 30 Project Managers across approx. 70 million dollar portfolio",
-                        "Oversee entire P&L across projects, resource allocations, scope change/creep, etc",
-                        "Improve, modernize, and digitize production, work streams, Ways of Working across the agency",
-                        "Manage and optimize program performance by tracking activities, goals, targets, KPIs, and budgets",
-                        "Indispensable partner across all disciplines; continuously partnering to improve and optimize delivery",
-                        "PM Driver for operationalizing AI practices within PM dept, overall agency"
-                    ]
-                },
-                {
-                    "company": "ACCENTURE, NEW YORK, NY",
-                    "dates": "2020 – 2023",
-                    "title": "Marketing and Communications Brand Delivery Lead",
-                    "bullets": [
-                        "Led change management in a dynamic and growing start-up environment",
-                        "Improved, modernized, and digitized production work streams by performing workflow and gap analysis",
-                        "Developed and mentored a project management team of 8-12 members",
-                        "Oversaw ~30 active projects across Health and Public Service, Comms & Media, High Tech, Banking, Insurance sectors",
-                        "Led PM Department leadership and growth along with managing P&L across all projects",
-                        "Promoted from NY Brand Delivery Lead to NA and Canada Brand Delivery Lead"
-                    ]
-                },
-                {
-                    "company": "FREELANCE",
-                    "dates": "2017 – 2019",
-                    "title": "Executive Producer/PMO Consultant",
-                    "bullets": [
-                        "Took charge of project portfolio management, initialized project management processes, and implemented project management tools and methods",
-                        "Led complex projects from initiation through deployment including user adoption and change management",
-                        "Worked through complex, multi-functional issues, led technical teams towards innovative and advanced solutions",
-                        "Clients included: Global VW Pitch (Won), Walmart CX Transformation, Pepperidge Farm, Proactive, Merck Content Hub, Cigna, Honeywell Pitch"
-                    ]
-                },
-                {
-                    "company": "Y&R NY",
-                    "dates": "2016 – 2017",
-                    "title": "VP, Director of Project Management and Digital Operations",
-                    "bullets": [
-                        "Built, grew, and led the PM Department of 10 Project Managers",
-                        "Oversaw entire P&L across projects, resource allocations, scope change/creep",
-                        "Performed workflow and gap analysis to improve, modernize, and digitize production work streams",
-                        "Managed and assessed program performance by tracking activities, goals, targets, KPIs, and budgets",
-                        "Identified process improvements, innovative solutions, and new tools for broader team capacity"
-                    ]
-                },
-                {
-                    "company": "FREELANCE",
-                    "dates": "2013 – 2016",
-                    "title": "Executive Producer",
-                    "bullets": [
-                        "Produced audience-first, engaging storytelling through digital articles, videos, social media, push alerts, live streams",
-                        "Clients: Ogilvy (UPS, Siemens), Atmosphere BBDO (Dubai Tourism), Havas Group (IBM), RAPP (NBCU, J&J, Pfizer)",
-                        "Clients: Ogilvy (eTrade, Citizens Bank), Geometry/G2 (Campbell's Soup/Pepperidge Farm)"
-                    ]
-                },
-                {
-                    "company": "PUBLICIS KAPLAN THALER",
-                    "dates": "2010 – 2013",
-                    "title": "Head of Digital Production",
-                    "bullets": [
-                        "Oversaw business of approx. $15-$20 million and scheduling, change management, and delivery processes",
-                        "Managed projects across 14 accounts including over 30 active projects for Wendy's, Merck, P&G, Napa, Champion",
-                        "Hired, supervised, trained, and managed a team of 5-7 digital producers",
-                        "Established and led the first Digital PM/Production Department for Kaplan Thaler Group",
-                        "Awards: 2 Webbys, 4 IACs, and 1 Golden Tweet Award"
-                    ]
-                }
-            ],
-            "education": [
-                {
-                    "degree": "MFA, Literature, Fiction, Writing",
-                    "school": "City University of New York-Brooklyn College"
-                },
-                {
-                    "degree": "B.A. Degree, Literature and Creative Writing",
-                    "school": "Binghamton University"
-                },
-                {
-                    "degree": "B.A. Degree, German; German Philology and Literature",
-                    "school": "University of Göttingen"
-                }
-            ]
-        }
+        """Load user's verified resume data (edit _USER_BASE_DATA above)"""
+        return _USER_BASE_DATA
     
     def process_job_posting(self, input_source: str) -> dict:
         """
@@ -160,6 +306,15 @@ class ResumeRetoolSystem:
         """
         print(f"\n📥 Processing input: {input_source[:100]}...")
         
+        # Reuse a previous run on the same input, if any
+        cache_file = self._cache_file(input_source)
+        ttl = _URL_RESULT_TTL if input_source.startswith(('http://', 'https://')) else None
+        cached = self._load_cached_result(cache_file, ttl)
+        if cached:
+            print(f"♻️  Reusing cached analysis: {cache_file}")
+            self._show_optimization_summary(cached['keyword_analysis'])
+            return cached
+        
         # Step 1: Extract job posting text
         extraction_result = self.extractor.extract_from_source(input_source)
         
@@ -193,8 +348,8 @@ class ResumeRetoolSystem:
         result = {
             'success': True,
             'input_source': input_source,
-            'extraction': extraction_result,
-            'keyword_analysis': keyword_report,
+            'extraction': _jsonable(extraction_result),
+            'keyword_analysis': _jsonable(keyword_report),
             'customized_resume': customized_resume,
             'timestamp': datetime.now().isoformat()
         }
@@ -202,202 +357,271 @@ class ResumeRetoolSystem:
         # Step 5: Show what changed
         self._show_optimization_summary(keyword_report)
         
+        self._save_cached_result(cache_file, result)
         return result
     
+    def _cache_file(self, input_source: str) -> Optional[Path]:
+        """Cache location for an input, or None when caching is off"""
+        if self.cache_dir is None:
+            return None
+        
+        key = hashlib.blake2b(input_source.encode(), digest_size=16)
+        key.update(self._views['digest'])
+        # Key files on their contents too, so an edited screenshot/PDF at the
+        # same path isn't answered from a stale entry
+        if os.path.isfile(input_source):
+            with open(input_source, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 16), b''):
+                    key.update(chunk)
+        return self.cache_dir / f"{key.hexdigest()}.json"
+    
+    def _load_cached_result(self, cache_file: Optional[Path],
+                            ttl: Optional[float] = None) -> Optional[dict]:
+        """Load a cached result, ignoring missing, unreadable or expired entries"""
+        if cache_file is None:
+            return None
+        try:
+            if ttl is not None and time.time() - cache_file.stat().st_mtime > ttl:
+                return None
+            return _read_json(cache_file)
+        except (OSError, ValueError):
+            return None
+    
+    def _save_cached_result(self, cache_file: Optional[Path], result: dict):
+        """Store a successful result for later runs"""
+        if cache_file is None:
+            return
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        _write_json(cache_file, result, indent=False)
+    
     def _generate_optimized_resume(self, extraction: dict, keyword_report: dict) -> str:
-        """Generate the keyword-optimized resume"""
+        """Generate the keyword-optimized resume, reusing an identical earlier one"""
         
         company = extraction.get('company', 'Target Company')
         position = extraction.get('position', 'Target Position')
         
-        resume_text = f"{self.user_base_data['full_name']}\n"
-        resume_text += f"{self.user_base_data['contact']}\n\n"
-
-        # Customized title line
-        resume_text += f"{position} Candidate | {self.user_base_data['title']}\n\n"
-        
-        # Professional summary optimized for keywords
-        resume_text += "PROFESSIONAL SUMMARY\n"
-        resume_text += self._optimize_summary(keyword_report)
-        resume_text += "\n\n"
-        
-        # Core competencies (reordered based on job requirements)
-        resume_text += "CORE COMPETENCIES\n"
-        optimized_skills = self._reorder_skills(keyword_report)
-        for skill in optimized_skills[:12]:
-            resume_text += f"• {skill}\n"
-        resume_text += "\n"
+        key = hashlib.blake2b(
+            json.dumps([company, position, keyword_report], sort_keys=True).encode(),
+            digest_size=16
+        ).digest()
+        resume = self._resume_memo.get(key)
+        if resume is None:
+            resume = self._build_optimized_resume(position, keyword_report)
+            self._resume_memo[key] = resume
+            if len(self._resume_memo) > _RESUME_MEMO_SIZE:
+                self._resume_memo.popitem(last=False)
+        else:
+            self._resume_memo.move_to_end(key)
+        return resume
+    
+    def _build_optimized_resume(self, position: str, keyword_report: dict) -> str:
+        """Build the resume text for a target position"""
+        
+        # Matched keywords in the forms the helpers below need, built once
+        ctx = self._match_context(keyword_report)
+        
+        views = self._views
+        parts = [
+            views['header'],
+            # Customized title line
+            f"{position}{views['title_suffix']}",
+            # Professional summary optimized for keywords
+            "PROFESSIONAL SUMMARY\n",
+            self._optimize_summary(ctx),
+            "\n\n",
+            # Core competencies (reordered based on job requirements)
+            "CORE COMPETENCIES\n",
+        ]
+        optimized_skills = self._reorder_skills(ctx)
+        parts.extend(f"• {skill}\n" for skill in islice(optimized_skills, 12))
+        parts.append("\n")
         
         # Professional experience with keyword optimization
-        resume_text += "PROFESSIONAL EXPERIENCE\n\n"
+        parts.append("PROFESSIONAL EXPERIENCE\n\n")
         
         # Select most relevant experiences based on job requirements
-        relevant_experiences = self._select_relevant_experiences(keyword_report)
+        relevant_experiences = self._select_relevant_experiences(ctx)
         
         for exp in relevant_experiences:
-            resume_text += f"{exp['company']:<50} {exp['dates']:>20}\n"
-            resume_text += f"{exp['title']}\n"
+            parts.append(f"{exp['company']:<50} {exp['dates']:>20}\n")
+            parts.append(f"{exp['title']}\n")
             
             # Optimize bullets based on keywords
-            optimized_bullets = self._optimize_bullets(exp['bullets'], keyword_report)
-            for bullet in optimized_bullets[:5]:  # Limit bullets for space
-                resume_text += f"• {bullet}\n"
-            resume_text += "\n"
+            optimized_bullets = self._optimize_bullets(exp['bullets'], ctx)
+            parts.extend(f"• {bullet}\n" for bullet in islice(optimized_bullets, 5))  # Limit bullets for space
+            parts.append("\n")
         
         # Education
-        resume_text += "EDUCATION\n"
-        for edu in self.user_base_data['education']:
-            resume_text += f"{edu['degree']} | {edu['school']}\n"
+        parts.append(views['education'])
         
-        return resume_text
+        return "".join(parts)
+    
+    def _match_context(self, keyword_report: dict) -> dict:
+        """Collect the matched keywords once for the resume helpers"""
+        matched = [m['keyword'] for m in keyword_report['matched_details']]
+        matched_lower = [keyword.lower() for keyword in matched]
+        matched_set = frozenset(matched_lower)
+        return {
+            'matched': matched,
+            'matched_set': matched_set,
+            'top3': frozenset(_WORD_RE.findall(" ".join(islice(matched_lower, 3)))),
+        }
     
-    def _select_relevant_experiences(self, keyword_report: dict) -> list:
+    def _select_relevant_experiences(self, ctx: dict) -> list:
         """Select most relevant experiences based on job requirements"""
         all_experiences = self.user_base_data['experience']
+        roles = self._views['roles']
+        
+        # Work with indices so membership checks are set lookups
+        selected = [0]  # Always include current role (TBWA)
+        seen = {0}
         
-        # Always include current role
-        selected = [all_experiences[0]]  # TBWA
+        def add(candidates):
+            for i in candidates:
+                if i not in seen:
+                    selected.append(i)
+                    seen.add(i)
+                    return
         
         # Check for specific keyword relevance
-        matched_keywords = {m['keyword'].lower() for m in keyword_report['matched_details']}
+        matched_keywords = ctx['matched_set']
         
         # Add Accenture if healthcare/enterprise keywords present
-        if any(kw in matched_keywords for kw in ['healthcare', 'health', 'enterprise', 'transformation']):
-            selected.append(all_experiences[1])  # Accenture
-        
-        # Add leadership roles for VP/executive positions
-        if any(kw in matched_keywords for kw in ['leadership', 'executive', 'vp', 'vice president', 'director']):
-            # Add Y&R VP role
-            for exp in all_experiences:
-                if 'Y&R' in exp['company'] and exp not in selected:
-                    selected.append(exp)
-                    break
+        if not matched_keywords.isdisjoint(_ENTERPRISE_KEYWORDS):
+            selected.append(1)  # Accenture
+            seen.add(1)
         
-        # Add digital/production experience if relevant
-        if any(kw in matched_keywords for kw in ['digital', 'production', 'operational']):
-            # Add Publicis role
-            for exp in all_experiences:
-                if 'PUBLICIS' in exp['company'] and exp not in selected:
-                    selected.append(exp)
-                    break
+        # Add leadership roles (Y&R VP role) for VP/executive positions
+        if not matched_keywords.isdisjoint(_LEADERSHIP_KEYWORDS):
+            add(roles['y&r'])
+        
+        # Add digital/production experience (Publicis role) if relevant
+        if not matched_keywords.isdisjoint(_PRODUCTION_KEYWORDS):
+            add(roles['publicis'])
         
         # Add freelance if we need more variety or consulting experience
-        if len(selected) < 3:
-            for exp in all_experiences:
-                if 'FREELANCE' in exp['company'] and '2017' in exp['dates']:
-                    selected.append(exp)
-                    break
+        if len(selected) < 3 and roles['freelance']:
+            selected.append(roles['freelance'][0])
+            seen.add(roles['freelance'][0])
         
         # Ensure we have at least 3-4 experiences but not more than 5
         if len(selected) < 3:
-            for exp in all_experiences[1:5]:
-                if exp not in selected:
-                    selected.append(exp)
+            for i in range(1, min(5, len(all_experiences))):
+                add((i,))
                 if len(selected) >= 4:
                     break
         
-        return selected[:5]  # Max 5 experiences for space
+        return [all_experiences[i] for i in islice(selected, 5)]  # Max 5 experiences for space
     
-    def _optimize_summary(self, keyword_report: dict) -> str:
+    def _optimize_summary(self, ctx: dict) -> str:
         """Create keyword-optimized summary"""
-        base_summary = "Highly accomplished executive with 20+ years driving "
+        parts = ["Highly accomplished executive with 20+ years driving "]
         
-        # Add matched keywords naturally
-        key_matches = [m['keyword'] for m in keyword_report['matched_details'][:3]]
+        # Add matched keywords naturally (whole words from the top matches)
+        key_matches = ctx['top3']
         
-        if 'strategic' in str(key_matches).lower():
-            base_summary += "strategic initiatives and "
+        if 'strategic' in key_matches:
+            parts.append("strategic initiatives and ")
         
-        if 'healthcare' in str(key_matches).lower():
-            base_summary += "transformation in healthcare and complex organizations. "
+        if 'healthcare' in key_matches:
+            parts.append("transformation in healthcare and complex organizations. ")
         else:
-            base_summary += "operational excellence in complex organizations. "
+            parts.append("operational excellence in complex organizations. ")
         
-        base_summary += "Proven track record of translating enterprise strategies into actionable plans, "
-        base_summary += "leading cross-functional teams, and delivering measurable outcomes. "
+        parts.append("Proven track record of translating enterprise strategies into actionable plans, ")
+        parts.append("leading cross-functional teams, and delivering measurable outcomes. ")
         
-        if 'change' in str(key_matches).lower():
-            base_summary += "Expert change agent driving organizational transformation."
+        if 'change' in key_matches:
+            parts.append("Expert change agent driving organizational transformation.")
         else:
-            base_summary += "Expert in scalable solution deployment and continuous improvement."
+            parts.append("Expert in scalable solution deployment and continuous improvement.")
         
-        return base_summary
+        return "".join(parts)
     
-    def _reorder_skills(self, keyword_report: dict) -> list:
+    def _reorder_skills(self, ctx: dict) -> list:
         """Reorder skills based on job requirements"""
-        matched_keywords = {m['keyword'].lower() for m in keyword_report['matched_details']}
+        # One index probe per keyword instead of a scan of every skill
+        hits = 0
+        for keyword in ctx['matched_set']:
+            hits |= self._views['skill_index'].get(keyword, 0)
 
         prioritized = []
         remaining = []
 
-        for skill in self.user_base_data['skills']:
-            skill_lower = skill.lower()
-            if any(keyword in skill_lower for keyword in matched_keywords):
+        for i, (skill, _) in enumerate(self._views['skills_lower']):
+            if hits >> i & 1:
                 prioritized.append(skill)
             else:
                 remaining.append(skill)
         
         return prioritized + remaining
     
-    def _optimize_bullets(self, bullets: list, keyword_report: dict) -> list:
+    def _optimize_bullets(self, bullets: list, ctx: dict) -> list:
         """Optimize experience bullets with keywords"""
-        matched_keywords = [m['keyword'] for m in keyword_report['matched_details']]
-        
-        optimized = []
-        for bullet in bullets:
-            # Apply keyword optimization
-            optimized_bullet = self.optimizer.rewrite_bullet_with_keywords(
-                bullet,
-                matched_keywords
-            )
-            optimized.append(optimized_bullet)
-        
-        return optimized
+        return self.optimizer.rewrite_bullets_with_keywords(bullets, ctx['matched'])
     
     def _show_optimization_summary(self, keyword_report: dict):
         """Show what was optimized"""
-        print("\n✨ Optimization Summary:")
-        print("=" * 50)
-        
-        print("\n✅ Keywords Successfully Matched:")
-        for match in keyword_report['matched_details'][:5]:
-            print(f"   • {match['keyword']} → {match['how_to_include']}")
+        # Collect the lines and print them with a single write
+        lines = [
+            "\n✨ Optimization Summary:",
+            "=" * 50,
+            "\n✅ Keywords Successfully Matched:",
+        ]
+        lines.extend(
+            f"   • {match['keyword']} → {match['how_to_include']}"
+            for match in islice(keyword_report['matched_details'], 5)
+        )
         
         if keyword_report['optimization_suggestions']:
-            print("\n💡 Optimization Suggestions:")
-            for suggestion in keyword_report['optimization_suggestions'][:3]:
-                print(f"   • For '{suggestion['missing']}': {suggestion['alternative']}")
+            lines.append("\n💡 Optimization Suggestions:")
+            lines.extend(
+                f"   • For '{suggestion['missing']}': {suggestion['alternative']}"
+                for suggestion in islice(keyword_report['optimization_suggestions'], 3)
+            )
         
         if keyword_report['unmatched_keywords']:
-            print("\n⚠️  Cannot Add (No Experience):")
-            for unmatched in keyword_report['unmatched_keywords'][:3]:
-                print(f"   • {unmatched['keyword']}: {unmatched['reason']}")
+            lines.append("\n⚠️  Cannot Add (No Experience):")
+            lines.extend(
+                f"   • {unmatched['keyword']}: {unmatched['reason']}"
+                for unmatched in islice(keyword_report['unmatched_keywords'], 3)
+            )
         
-        print("\n🛡️  Integrity Check: All content is 100% based on actual experience")
+        lines.append("\n🛡️  Integrity Check: All content is 100% based on actual experience")
+        print("\n".join(lines))
     
     def save_results(self, results: dict, output_dir: str = "output"):
         """Save all results"""
         Path(output_dir).mkdir(exist_ok=True)
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        company = results['extraction'].get('company', 'unknown').replace(' ', '_')
+        # Name files after the run's own timestamp so they match the report
+        timestamp = datetime.fromisoformat(results['timestamp']).strftime("%Y%m%d_%H%M%S")
+        company = (results['extraction'].get('company') or 'unknown').translate(_FILENAME_TRANS)[:64]
         
-        # Save customized resume as text
         resume_file = f"{output_dir}/resume_{company}_{timestamp}.txt"
-        with open(resume_file, 'w') as f:
-            f.write(results['customized_resume'])
-        print(f"\n💾 Resume saved to: {resume_file}")
-        
-        # Generate professional PDF
         pdf_file = f"{output_dir}/resume_{company}_{timestamp}.pdf"
-        create_professional_pdf(results['customized_resume'], pdf_file)
-        print(f"📄 PDF resume saved to: {pdf_file}")
-        
-        # Save analysis report
+        job_file = f"{output_dir}/job_{company}_{timestamp}.txt"
         report_file = f"{output_dir}/analysis_{company}_{timestamp}.json"
-        with open(report_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
-        print(f"📊 Analysis saved to: {report_file}")
+        
+        # Keep the job text in its own file so the report doesn't carry a copy
+        extraction = dict(results['extraction'])
+        job_text = extraction.pop('job_text', '') or ''
+        
+        from pdf_generator_pro import create_professional_pdf
+        
+        # The text/JSON writes are I/O and overlap with PDF rendering
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            pdf_done = pool.submit(create_professional_pdf, results['customized_resume'], pdf_file)
+            resume_done = pool.submit(_write_text, resume_file, results['customized_resume'])
+            job_done = pool.submit(_write_text, job_file, job_text)
+            _write_json(report_file, {**results, 'extraction': extraction})
+            
+            resume_done.result()
+            print(f"\n💾 Resume saved to: {resume_file}")
+            pdf_done.result()
+            print(f"📄 PDF resume saved to: {pdf_file}")
+            job_done.result()
+            print(f"📊 Analysis saved to: {report_file} (job text: {job_file})")
 
 def main():
     parser = argparse.ArgumentParser(
@@ -412,25 +636,34 @@ def main():
         default='output',
         help='Directory for output files'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore and do not write cached results'
+    )
     
     args = parser.parse_args()
 
     # Initialize system
-    system = ResumeRetoolSystem()
+    cache_dir = None if args.no_cache else os.path.join(args.output_dir, '.cache')
+    system = ResumeRetoolSystem(cache_dir=cache_dir)
     
-    # Process job posting
-    results = system.process_job_posting(args.input)
-    
-    if results['success']:
-        # Save results
-        system.save_results(results, args.output_dir)
+    try:
+        # Process job posting
+        results = system.process_job_posting(args.input)
         
-        print("\n✅ Resume customization complete!")
-        print("📋 Please review before submitting")
-        print("🛡️  Reminder: All content is factual - no fabrication")
-    else:
-        print(f"\n❌ Error: {results['error']}")
-        sys.exit(1)
+        if results['success']:
+            # Save results
+            system.save_results(results, args.output_dir)
+            
+            print("\n✅ Resume customization complete!")
+            print("📋 Please review before submitting")
+            print("🛡️  Reminder: All content is factual - no fabrication")
+        else:
+            print(f"\n❌ Error: {results['error']}")
+            sys.exit(1)
+    finally:
+        system.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
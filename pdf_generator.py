@@ -8,106 +8,201 @@ from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.platypus.paragraph import cleanBlockQuotedText
+from reportlab.platypus.paraparser import ParaParser
 from reportlab.lib import colors
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
-from reportlab.pdfgen import canvas
-from datetime import datetime
-import os
+from reportlab.lib.enums import TA_LEFT, TA_CENTER
+import functools
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import zip_longest
+from types import MappingProxyType
+
+# Section headings recognised by _parse_resume_text, in priority order
+_SECTIONS = {
+    'PROFESSIONAL SUMMARY': 'summary',
+    'CORE COMPETENCIES': 'skills',
+    'PROFESSIONAL EXPERIENCE': 'experience',
+    'EDUCATION': 'education',
+}
+_SECTION_ORDER = list(_SECTIONS)
+_SECTION_RE = re.compile('|'.join(map(re.escape, _SECTIONS)))
+
+# Palette shared by every style and table
+_NAVY = colors.HexColor('#2C3E50')
+_SLATE = colors.HexColor('#34495E')
+_BLUE = colors.HexColor('#3498DB')
+
+@functools.lru_cache(maxsize=1)
+def _get_styles():
+    """
+    Sample stylesheet plus the resume styles, built once per process
+    ParagraphStyles are only read while building, so generators share them
+    """
+    styles = getSampleStyleSheet()
+    _add_resume_styles(styles)
+    return styles
+
+def _add_resume_styles(styles):
+    """Create custom styles for resume sections"""
+    
+    # Name style
+    styles.add(ParagraphStyle(
+        name='ResumeName',
+        parent=styles['Title'],
+        fontSize=20,
+        textColor=_NAVY,
+        spaceAfter=6,
+        alignment=TA_CENTER
+    ))
+    
+    # Contact style
+    styles.add(ParagraphStyle(
+        name='Contact',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=_SLATE,
+        alignment=TA_CENTER,
+        spaceAfter=12
+    ))
+    
+    # Title style
+    styles.add(ParagraphStyle(
+        name='ResumeTitle',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=_NAVY,
+        alignment=TA_CENTER,
+        spaceAfter=18,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Section header style
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=12,
+        textColor=_NAVY,
+        spaceAfter=8,
+        spaceBefore=12,
+        fontName='Helvetica-Bold',
+        borderColor=_BLUE,
+        borderWidth=0,
+        borderPadding=0
+    ))
+    
+    # Company/School name style
+    styles.add(ParagraphStyle(
+        name='Organization',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=_NAVY,
+        spaceAfter=2,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Job title style
+    styles.add(ParagraphStyle(
+        name='JobTitle',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=_SLATE,
+        spaceAfter=4,
+        fontName='Helvetica-Oblique'
+    ))
+    
+    # Bullet point style
+    styles.add(ParagraphStyle(
+        name='BulletPoint',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=_NAVY,
+        leftIndent=20,
+        bulletIndent=8,
+        spaceAfter=4
+    ))
+    
+    # Summary style
+    styles.add(ParagraphStyle(
+        name='Summary',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=_NAVY,
+        spaceAfter=12,
+        alignment=TA_LEFT
+    ))
+
+@functools.lru_cache(maxsize=None)
+def _frag_template(style):
+    """The single fragment ParaParser produces for plain text in a style"""
+    _, frags, _ = ParaParser().parse('x', style)
+    return frags[0]
+
+def _para(text, style, bulletText=None):
+    """
+    Paragraph that skips ParaParser for plain text
+    Text with markup or entities ('<', '&') still goes through the parser
+    """
+    if '<' not in text and '&' not in text:
+        text = cleanBlockQuotedText(text)
+        if text:
+            frag = _frag_template(style).clone(text=text, link=[], us_lines=[])
+            return Paragraph(text, style, bulletText=bulletText, frags=[frag])
+    return Paragraph(text, style, bulletText=bulletText)
+
+@functools.lru_cache(maxsize=None)
+def _markup_template(markup, style):
+    """
+    Fragments ParaParser produces for a '{}' markup template in a style
+    Field i is parsed as the private-use character U+E000+i, so the
+    fields can be substituted into the fragment texts afterwards
+    """
+    slots = tuple(chr(0xE000 + i) for i in range(markup.count('{}')))
+    _, frags, _ = ParaParser().parse(markup.format(*slots), style)
+    return slots, tuple(frags)
+
+def _markup_para(markup, style, *fields):
+    """
+    Paragraph for a fixed markup template filled with plain-text fields
+    Fields that are empty, carry markup or need whitespace cleaning would
+    change the fragment structure, and fields containing a slot character
+    would be overwritten by a later substitution, so those still go
+    through the parser
+    """
+    text = markup.format(*fields)
+    slots, template = _markup_template(markup, style)
+    for field in fields:
+        if (not field or '<' in field or '&' in field
+                or field != cleanBlockQuotedText(field)
+                or any(slot in field for slot in slots)):
+            return Paragraph(text, style)
+    
+    frags = []
+    for frag in template:
+        frag_text = frag.text
+        for slot, field in zip(slots, fields):
+            frag_text = frag_text.replace(slot, field)
+        frags.append(frag.clone(text=frag_text, link=[], us_lines=[]))
+    return Paragraph(text, style, frags=frags)
 
 class ResumePDFGenerator:
     """Generate professional PDF resumes"""
     
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._create_custom_styles()
+    # Skills table layout never changes between documents; Table copies the
+    # style commands on setStyle, so one TableStyle can be shared
+    _SKILLS_COLWIDTHS = (2.3*inch, 2.3*inch, 2.3*inch)
+    _SKILLS_TABLE_STYLE = TableStyle([
+        ('FONT', (0, 0), (-1, -1), 'Helvetica', 9),
+        ('TEXTCOLOR', (0, 0), (-1, -1), _NAVY),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ('TOPPADDING', (0, 0), (-1, -1), 2),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+    ])
     
-    def _create_custom_styles(self):
-        """Create custom styles for resume sections"""
-        
-        # Name style
-        self.styles.add(ParagraphStyle(
-            name='ResumeName',
-            parent=self.styles['Title'],
-            fontSize=20,
-            textColor=colors.HexColor('#2C3E50'),
-            spaceAfter=6,
-            alignment=TA_CENTER
-        ))
-        
-        # Contact style
-        self.styles.add(ParagraphStyle(
-            name='Contact',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#34495E'),
-            alignment=TA_CENTER,
-            spaceAfter=12
-        ))
-        
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='ResumeTitle',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            textColor=colors.HexColor('#2C3E50'),
-            alignment=TA_CENTER,
-            spaceAfter=18,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Section header style
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading2'],
-            fontSize=12,
-            textColor=colors.HexColor('#2C3E50'),
-            spaceAfter=8,
-            spaceBefore=12,
-            fontName='Helvetica-Bold',
-            borderColor=colors.HexColor('#3498DB'),
-            borderWidth=0,
-            borderPadding=0
-        ))
-        
-        # Company/School name style
-        self.styles.add(ParagraphStyle(
-            name='Organization',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            textColor=colors.HexColor('#2C3E50'),
-            spaceAfter=2,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Job title style
-        self.styles.add(ParagraphStyle(
-            name='JobTitle',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#34495E'),
-            spaceAfter=4,
-            fontName='Helvetica-Oblique'
-        ))
-        
-        # Bullet point style
-        self.styles.add(ParagraphStyle(
-            name='BulletPoint',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#2C3E50'),
-            leftIndent=20,
-            spaceAfter=4
-        ))
-        
-        # Summary style
-        self.styles.add(ParagraphStyle(
-            name='Summary',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#2C3E50'),
-            spaceAfter=12,
-            alignment=TA_LEFT
-        ))
+    def __init__(self):
+        self.styles = _get_styles()
     
     def generate_pdf(self, resume_data: dict, output_path: str):
         """
@@ -126,87 +221,95 @@ class ResumePDFGenerator:
             bottomMargin=0.5*inch
         )
         
-        story = []
+        # Build PDF
+        doc.build(list(self._iter_story(resume_data)))
         
+        return output_path
+    
+    def _iter_story(self, resume_data: dict):
+        """Yield the flowables for one resume, in document order"""
         # Name
-        story.append(Paragraph(resume_data['full_name'], self.styles['ResumeName']))
+        yield _para(resume_data['full_name'], self.styles['ResumeName'])
         
         # Contact
-        story.append(Paragraph(resume_data['contact'], self.styles['Contact']))
+        yield _para(resume_data['contact'], self.styles['Contact'])
         
         # Title
         if 'customized_title' in resume_data:
-            story.append(Paragraph(resume_data['customized_title'], self.styles['ResumeTitle']))
+            yield _para(resume_data['customized_title'], self.styles['ResumeTitle'])
         elif 'title' in resume_data:
-            story.append(Paragraph(resume_data['title'], self.styles['ResumeTitle']))
+            yield _para(resume_data['title'], self.styles['ResumeTitle'])
         
         # Professional Summary
-        story.append(Paragraph('PROFESSIONAL SUMMARY', self.styles['SectionHeader']))
-        story.append(Paragraph(resume_data['summary'], self.styles['Summary']))
+        yield _para('PROFESSIONAL SUMMARY', self.styles['SectionHeader'])
+        yield _para(resume_data['summary'], self.styles['Summary'])
         
         # Core Competencies
-        story.append(Paragraph('CORE COMPETENCIES', self.styles['SectionHeader']))
+        yield _para('CORE COMPETENCIES', self.styles['SectionHeader'])
         
         # Create skills in columns
-        skills_data = []
         skills = resume_data.get('skills', [])
         
-        # Split skills into 3 columns
+        # Split skills into 3 columns, filled top to bottom
         cols = 3
         rows = len(skills) // cols + (1 if len(skills) % cols else 0)
-        
-        for i in range(rows):
-            row = []
-            for j in range(cols):
-                idx = i + j * rows
-                if idx < len(skills):
-                    row.append(f"• {skills[idx]}")
-                else:
-                    row.append("")
-            skills_data.append(row)
+        bulleted = [f"• {skill}" for skill in skills]
+        columns = [bulleted[k * rows:(k + 1) * rows] for k in range(cols)]
+        skills_data = [list(row) for row in zip_longest(*columns, fillvalue="")]
         
         if skills_data:
-            skills_table = Table(skills_data, colWidths=[2.3*inch, 2.3*inch, 2.3*inch])
-            skills_table.setStyle(TableStyle([
-                ('FONT', (0, 0), (-1, -1), 'Helvetica', 9),
-                ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#2C3E50')),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                ('TOPPADDING', (0, 0), (-1, -1), 2),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-            ]))
-            story.append(skills_table)
-            story.append(Spacer(1, 0.2*inch))
+            skills_table = Table(skills_data, colWidths=self._SKILLS_COLWIDTHS)
+            skills_table.setStyle(self._SKILLS_TABLE_STYLE)
+            yield skills_table
+            yield Spacer(1, 0.2*inch)
         
         # Professional Experience
-        story.append(Paragraph('PROFESSIONAL EXPERIENCE', self.styles['SectionHeader']))
+        yield _para('PROFESSIONAL EXPERIENCE', self.styles['SectionHeader'])
         
         for exp in resume_data.get('experience', []):
             # Company and dates on same line
-            exp_header = f"<b>{exp['company']}</b> <i>{exp.get('dates', '')}</i>"
-            story.append(Paragraph(exp_header, self.styles['Organization']))
+            yield _markup_para("<b>{}</b> <i>{}</i>", self.styles['Organization'],
+                               exp['company'], exp.get('dates', ''))
             
             # Job title
-            story.append(Paragraph(exp['title'], self.styles['JobTitle']))
+            yield _para(exp['title'], self.styles['JobTitle'])
             
             # Bullets
             for bullet in exp.get('bullets', []):
-                story.append(Paragraph(f"• {bullet}", self.styles['BulletPoint']))
+                yield _para(bullet, self.styles['BulletPoint'], bulletText='•')
             
-            story.append(Spacer(1, 0.1*inch))
+            yield Spacer(1, 0.1*inch)
         
         # Education
-        story.append(Paragraph('EDUCATION', self.styles['SectionHeader']))
+        yield _para('EDUCATION', self.styles['SectionHeader'])
         
         for edu in resume_data.get('education', []):
-            edu_text = f"<b>{edu['degree']}</b> | {edu['school']}"
-            story.append(Paragraph(edu_text, self.styles['Normal']))
+            yield _markup_para("<b>{}</b> | {}", self.styles['Normal'],
+                               edu['degree'], edu['school'])
+    
+    def generate_pdfs(self, resume_data_list: list, output_paths: list, workers: int = None):
+        """
+        Generate several PDFs, optionally sharded across worker processes
         
-        # Build PDF
-        doc.build(story)
+        Layout is pure-Python and CPU-bound, so large batches scale with
+        processes; small batches run in-process with the shared styles.
         
-        return output_path
+        Args:
+            resume_data_list: Dictionaries as accepted by generate_pdf
+            output_paths: Output PDF path for each resume
+            workers: Number of worker processes (default: run in-process)
+            
+        Returns:
+            List of output paths, in the same order as resume_data_list
+        """
+        if len(resume_data_list) != len(output_paths):
+            raise ValueError("resume_data_list and output_paths differ in length")
+        jobs = list(zip(resume_data_list, output_paths))
+        if not workers or workers < 2 or len(jobs) < 2:
+            return [self.generate_pdf(data, path) for data, path in jobs]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_generate_one, jobs))
     
     def text_to_pdf(self, resume_text: str, output_path: str):
         """
@@ -216,14 +319,37 @@ class ResumePDFGenerator:
             resume_text: Plain text resume
             output_path: Path for output PDF
         """
-        # Parse text into structured data
-        resume_data = self._parse_resume_text(resume_text)
+        # Parse text into structured data (cached; read-only)
+        resume_data = self._parse_resume_text_cached(resume_text)
         
         # Generate PDF
         return self.generate_pdf(resume_data, output_path)
     
-    def _parse_resume_text(self, text: str) -> dict:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _parse_resume_text_cached(text: str) -> MappingProxyType:
+        """
+        Parsed resume shared across text_to_pdf calls on the same text
+        Lists become tuples and dicts read-only views, so no caller can
+        alter the cached copy
+        """
+        data = ResumePDFGenerator._parse_resume_text(text)
+        return MappingProxyType({
+            **data,
+            'skills': tuple(data['skills']),
+            'experience': tuple(
+                MappingProxyType({**exp, 'bullets': tuple(exp['bullets'])})
+                for exp in data['experience']
+            ),
+            'education': tuple(MappingProxyType(edu) for edu in data['education']),
+        })
+    
+    @staticmethod
+    def _parse_resume_text(text: str) -> dict:
         """Parse plain text resume into structured format"""
+        # Only '\n' separates lines: splitlines() would also break on \v, \f,
+        # \x1c-\x1e, \x85, \u2028/\u2029 in scraped text and shift the
+        # positional name/contact/title lines ('\r' is removed by strip())
         lines = text.strip().split('\n')
         
         resume_data = {
@@ -239,12 +365,14 @@ class ResumePDFGenerator:
         # Simple parsing logic
         current_section = None
         current_exp = None
+        summary_parts = []
         
-        for i, line in enumerate(lines):
-            line = line.strip()
-            
-            if not line:
+        for i, raw in enumerate(lines):
+            # isspace() stops at the first visible character, so blank
+            # lines are dropped without allocating a stripped copy
+            if not raw or raw.isspace():
                 continue
+            line = raw.strip()
             
             # First line is name
             if i == 0:
@@ -253,18 +381,16 @@ class ResumePDFGenerator:
                 resume_data['contact'] = line
             elif i == 2 and '|' in line:
                 resume_data['title'] = line
-            elif 'PROFESSIONAL SUMMARY' in line:
-                current_section = 'summary'
-            elif 'CORE COMPETENCIES' in line:
-                current_section = 'skills'
-            elif 'PROFESSIONAL EXPERIENCE' in line:
-                current_section = 'experience'
-            elif 'EDUCATION' in line:
-                current_section = 'education'
+            elif line in _SECTIONS:
+                # Bare heading line: one hash lookup, no scan
+                current_section = _SECTIONS[line]
+            elif (headings := _SECTION_RE.findall(line)):
+                # Earliest-listed heading wins if a line names several
+                current_section = _SECTIONS[min(headings, key=_SECTION_ORDER.index)]
             else:
                 # Add content to current section
                 if current_section == 'summary':
-                    resume_data['summary'] += line + ' '
+                    summary_parts.append(line)
                 elif current_section == 'skills' and line.startswith('•'):
                     resume_data['skills'].append(line[1:].strip())
                 elif current_section == 'experience':
@@ -273,12 +399,12 @@ class ResumePDFGenerator:
                         if current_exp:
                             resume_data['experience'].append(current_exp)
                         
-                        # Try to parse company and dates
-                        parts = line.rsplit(' ', 3)
-                        if len(parts) >= 2 and '–' in parts[-1]:
+                        # Try to parse company and dates (last word)
+                        company, sep, dates = line.rpartition(' ')
+                        if sep and '–' in dates:
                             current_exp = {
-                                'company': ' '.join(parts[:-1]),
-                                'dates': parts[-1],
+                                'company': company,
+                                'dates': dates,
                                 'title': '',
                                 'bullets': []
                             }
@@ -294,17 +420,31 @@ class ResumePDFGenerator:
                     elif current_exp and line.startswith('•'):
                         current_exp['bullets'].append(line[1:].strip())
                 elif current_section == 'education':
-                    resume_data['education'].append({
-                        'degree': line.split('|')[0].strip() if '|' in line else line,
-                        'school': line.split('|')[1].strip() if '|' in line else ''
-                    })
+                    degree, sep, rest = line.partition('|')
+                    if sep:
+                        # School is the field after the first '|' only
+                        school = rest.partition('|')[0]
+                        resume_data['education'].append({
+                            'degree': degree.strip(),
+                            'school': school.strip()
+                        })
+                    else:
+                        resume_data['education'].append({'degree': line, 'school': ''})
         
         # Add last experience
         if current_exp:
             resume_data['experience'].append(current_exp)
         
+        # Each summary line keeps its trailing space, as before
+        resume_data['summary'] = ''.join(f"{part} " for part in summary_parts)
+        
         return resume_data
 
+def _generate_one(job):
+    """Render one (resume_data, output_path) pair (module-level so worker processes can pickle it)"""
+    resume_data, output_path = job
+    return ResumePDFGenerator().generate_pdf(resume_data, output_path)
+
 # Example usage
 if __name__ == "__main__":
     generator = ResumePDFGenerator()
@@ -5,17 +5,206 @@ Creates ATS-friendly, beautifully styled PDF resumes
 """
 
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch, mm
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, KeepTogether
 from reportlab.platypus.flowables import HRFlowable
+from reportlab.platypus.paragraph import cleanBlockQuotedText
+from reportlab.platypus.paraparser import ParaParser
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
 from reportlab.pdfgen import canvas
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from datetime import datetime
+import functools
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import zip_longest
+from types import MappingProxyType
+import re
+
+# Section headings recognised by _parse_resume_text (matched anywhere in the
+# upper-cased line), and the order in which they take precedence
+_SECTIONS = {
+    'PROFESSIONAL SUMMARY': 'summary',
+    'CORE COMPETENCIES': 'skills',
+    'SKILLS': 'skills',
+    'PROFESSIONAL EXPERIENCE': 'experience',
+    'WORK EXPERIENCE': 'experience',
+    'EDUCATION': 'education',
+}
+_SECTION_ORDER = ('summary', 'skills', 'experience', 'education')
+_SECTION_RE = re.compile('|'.join(map(re.escape, _SECTIONS)))
+
+# Years that mark an experience header line
+_YEAR_RE = re.compile('202[0-5]')
+
+# A '|' contact separator and the whitespace around it
+_CONTACT_SEP_RE = re.compile(r'\s*\|\s*')
+
+# "COMPANY, CITY 2020 – 2023": a trailing date range, optionally with one
+# more word ("2020 – Present", "2019-2021 (contract)")
+_COMPANY_DATES_RE = re.compile(r'^(?P<company>.+?)\s+(?P<dates>\S+\s*[–-]\s*\S+(?:\s+\S+)?)\s*$')
+
+@functools.lru_cache(maxsize=None)
+def _frag_template(style):
+    """The single fragment ParaParser produces for plain text in a style"""
+    _, frags, _ = ParaParser().parse('x', style)
+    return frags[0]
+
+def _para(text, style):
+    """
+    Paragraph that skips ParaParser for plain text
+    Text with markup or entities ('<', '&') still goes through the parser
+    """
+    if '<' not in text and '&' not in text:
+        text = cleanBlockQuotedText(text)
+        if text:
+            frag = _frag_template(style).clone(text=text, link=[], us_lines=[])
+            return Paragraph(text, style, frags=[frag])
+    return Paragraph(text, style)
+
+# Palette shared by every style and separator
+_COLORS = MappingProxyType({
+    'primary': colors.HexColor('#2C3E50'),      # Dark blue-gray for headers
+    'secondary': colors.HexColor('#34495E'),    # Medium gray for subheaders
+    'accent': colors.HexColor('#3498DB'),       # Blue accent for lines
+    'text': colors.HexColor('#2C3E50'),         # Dark text for readability
+    'light': colors.HexColor('#7F8C8D'),        # Light gray for secondary info
+})
+
+@functools.lru_cache(maxsize=1)
+def _build_styles():
+    """
+    Create elegant, ATS-friendly styles, once per process
+    Every style sets its own font, size, leading and colour, so none
+    needs a parent from the sample stylesheet
+    """
+    styles = {}
+    
+    def add(style):
+        styles[style.name] = style
+    
+    # Name style - Large, bold, centered
+    add(ParagraphStyle(
+        name='Name',
+        fontSize=24,
+        leading=28,
+        textColor=_COLORS['primary'],
+        spaceAfter=6,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Contact style - Clean, centered, smaller
+    add(ParagraphStyle(
+        name='Contact',
+        fontSize=10,
+        leading=12,
+        textColor=_COLORS['secondary'],
+        alignment=TA_CENTER,
+        spaceAfter=4,
+        fontName='Helvetica'
+    ))
+    
+    # Professional title
+    add(ParagraphStyle(
+        name='ProfessionalTitle',
+        fontSize=12,
+        leading=14,
+        textColor=_COLORS['primary'],
+        alignment=TA_CENTER,
+        spaceAfter=12,
+        spaceBefore=4,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Section headers - Clean with subtle accent
+    add(ParagraphStyle(
+        name='SectionHeader',
+        fontSize=13,
+        leading=16,
+        textColor=_COLORS['primary'],
+        spaceAfter=8,
+        spaceBefore=14,
+        fontName='Helvetica-Bold',
+        alignment=TA_LEFT
+    ))
+    
+    # Company/Organization name
+    add(ParagraphStyle(
+        name='Company',
+        fontSize=11,
+        leading=13,
+        textColor=_COLORS['primary'],
+        spaceAfter=2,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Job title/Position
+    add(ParagraphStyle(
+        name='JobTitle',
+        fontSize=10,
+        leading=12,
+        textColor=_COLORS['secondary'],
+        spaceAfter=6,
+        fontName='Helvetica-Oblique'
+    ))
+    
+    # Date style - Right aligned
+    add(ParagraphStyle(
+        name='Dates',
+        fontSize=10,
+        leading=12,
+        textColor=_COLORS['light'],
+        alignment=TA_RIGHT,
+        fontName='Helvetica'
+    ))
+    
+    # Bullet points - Clean and readable
+    add(ParagraphStyle(
+        name='Bullet',
+        fontSize=10,
+        leading=13,
+        textColor=_COLORS['text'],
+        leftIndent=15,
+        spaceAfter=3,
+        fontName='Helvetica',
+        alignment=TA_JUSTIFY
+    ))
+    
+    # Professional summary
+    add(ParagraphStyle(
+        name='Summary',
+        fontSize=10,
+        leading=13,
+        textColor=_COLORS['text'],
+        spaceAfter=12,
+        alignment=TA_JUSTIFY,
+        fontName='Helvetica'
+    ))
+    
+    # Skills style
+    add(ParagraphStyle(
+        name='Skill',
+        fontSize=10,
+        leading=12,
+        textColor=_COLORS['text'],
+        fontName='Helvetica'
+    ))
+    
+    # Education style
+    add(ParagraphStyle(
+        name='Education',
+        fontSize=10,
+        leading=12,
+        textColor=_COLORS['text'],
+        spaceAfter=4,
+        fontName='Helvetica'
+    ))
+    
+    return MappingProxyType(styles)
 
 class ProfessionalResumePDF:
     """
@@ -23,148 +212,33 @@ class ProfessionalResumePDF:
     Following best practices for executive resume design
     """
     
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self.colors = {
-            'primary': colors.HexColor('#2C3E50'),      # Dark blue-gray for headers
-            'secondary': colors.HexColor('#34495E'),    # Medium gray for subheaders
-            'accent': colors.HexColor('#3498DB'),       # Blue accent for lines
-            'text': colors.HexColor('#2C3E50'),         # Dark text for readability
-            'light': colors.HexColor('#7F8C8D'),        # Light gray for secondary info
-        }
-        self._create_professional_styles()
+    # Page geometry (points), fixed for every document
+    _MARGIN = 0.75*inch
+    _SKILL_COL_WIDTHS = (2.2*inch, 2.2*inch, 2.2*inch)
+    _COMPANY_DATE_WIDTHS = (4.5*inch, 2*inch)
+    _SKILLS_GAP = 0.15*inch
+    _EXPERIENCE_GAP = 0.1*inch
     
-    def _create_professional_styles(self):
-        """Create elegant, ATS-friendly styles"""
-        
-        # Name style - Large, bold, centered
-        self.styles.add(ParagraphStyle(
-            name='Name',
-            parent=self.styles['Title'],
-            fontSize=24,
-            leading=28,
-            textColor=self.colors['primary'],
-            spaceAfter=6,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Contact style - Clean, centered, smaller
-        self.styles.add(ParagraphStyle(
-            name='Contact',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            leading=12,
-            textColor=self.colors['secondary'],
-            alignment=TA_CENTER,
-            spaceAfter=4,
-            fontName='Helvetica'
-        ))
-        
-        # Professional title
-        self.styles.add(ParagraphStyle(
-            name='ProfessionalTitle',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            leading=14,
-            textColor=self.colors['primary'],
-            alignment=TA_CENTER,
-            spaceAfter=12,
-            spaceBefore=4,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Section headers - Clean with subtle accent
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading1'],
-            fontSize=13,
-            leading=16,
-            textColor=self.colors['primary'],
-            spaceAfter=8,
-            spaceBefore=14,
-            fontName='Helvetica-Bold',
-            alignment=TA_LEFT
-        ))
-        
-        # Company/Organization name
-        self.styles.add(ParagraphStyle(
-            name='Company',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            leading=13,
-            textColor=self.colors['primary'],
-            spaceAfter=2,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Job title/Position
-        self.styles.add(ParagraphStyle(
-            name='JobTitle',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            leading=12,
-            textColor=self.colors['secondary'],
-            spaceAfter=6,
-            fontName='Helvetica-Oblique'
-        ))
-        
-        # Date style - Right aligned
-        self.styles.add(ParagraphStyle(
-            name='Dates',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            leading=12,
-            textColor=self.colors['light'],
-            alignment=TA_RIGHT,
-            fontName='Helvetica'
-        ))
-        
-        # Bullet points - Clean and readable
-        self.styles.add(ParagraphStyle(
-            name='Bullet',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            leading=13,
-            textColor=self.colors['text'],
-            leftIndent=15,
-            spaceAfter=3,
-            fontName='Helvetica',
-            alignment=TA_JUSTIFY
-        ))
-        
-        # Professional summary
-        self.styles.add(ParagraphStyle(
-            name='Summary',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            leading=13,
-            textColor=self.colors['text'],
-            spaceAfter=12,
-            alignment=TA_JUSTIFY,
-            fontName='Helvetica'
-        ))
-        
-        # Skills style
-        self.styles.add(ParagraphStyle(
-            name='Skill',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            leading=12,
-            textColor=self.colors['text'],
-            fontName='Helvetica'
-        ))
-        
-        # Education style
-        self.styles.add(ParagraphStyle(
-            name='Education',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            leading=12,
-            textColor=self.colors['text'],
-            spaceAfter=4,
-            fontName='Helvetica'
-        ))
+    # Table layouts shared by every document; Table copies the commands
+    # on setStyle, so one TableStyle of each kind is enough
+    _SKILL_TABLE_STYLE = TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+        ('TOPPADDING', (0, 0), (-1, -1), 2),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+    ])
+    _COMPANY_DATE_STYLE = TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (0, 0), 0),
+        ('RIGHTPADDING', (-1, -1), (-1, -1), 0),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+    ])
+    
+    def __init__(self):
+        self.styles = _build_styles()
+        self.colors = _COLORS
     
     def create_header_line(self):
         """Create a subtle line separator"""
@@ -181,10 +255,8 @@ class ProfessionalResumePDF:
     def format_contact_info(self, contact):
         """Format contact information with proper separators"""
         # Clean format with bullet separators
-        parts = contact.split('|')
-        if len(parts) > 1:
-            formatted = " • ".join([p.strip() for p in parts])
-            return formatted
+        if '|' in contact:
+            return _CONTACT_SEP_RE.sub(' • ', contact.strip())
         return contact
     
     def generate_pdf(self, resume_data, output_path):
@@ -193,108 +265,96 @@ class ProfessionalResumePDF:
         
         Args:
             resume_data: Dictionary with resume information
-            output_path: Path for the output PDF
+            output_path: Path for the output PDF, or a writable binary
+                file object (e.g. BytesIO) to stream it to instead
         """
         # Create document with proper margins for ATS scanning
         doc = SimpleDocTemplate(
             output_path,
             pagesize=letter,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=0.75*inch,
-            bottomMargin=0.75*inch
+            rightMargin=self._MARGIN,
+            leftMargin=self._MARGIN,
+            topMargin=self._MARGIN,
+            bottomMargin=self._MARGIN,
+            # Reproducible bytes (no timestamp or random ID), compressed pages
+            invariant=1,
+            pageCompression=1
         )
         
+        # Read each section once
+        title = resume_data.get('title')
+        summary = resume_data.get('summary')
+        skills = resume_data.get('skills')
+        experience = resume_data.get('experience')
+        education = resume_data.get('education')
+        styles = self.styles
+        
         # Build the resume content
         story = []
         
         # HEADER SECTION
         # Name
-        story.append(Paragraph(resume_data.get('full_name', ''), self.styles['Name']))
+        story.append(_para(resume_data.get('full_name', ''), styles['Name']))
         
         # Contact information
         contact = self.format_contact_info(resume_data.get('contact', ''))
-        story.append(Paragraph(contact, self.styles['Contact']))
+        story.append(_para(contact, styles['Contact']))
         
         # Professional title (if provided)
-        if resume_data.get('title'):
-            story.append(Paragraph(resume_data['title'], self.styles['ProfessionalTitle']))
+        if title:
+            story.append(_para(title, styles['ProfessionalTitle']))
         
         # Subtle separator line
         story.append(self.create_header_line())
         
         # PROFESSIONAL SUMMARY
-        if resume_data.get('summary'):
-            story.append(Paragraph('PROFESSIONAL SUMMARY', self.styles['SectionHeader']))
-            story.append(Paragraph(resume_data['summary'], self.styles['Summary']))
+        if summary:
+            story.append(_para('PROFESSIONAL SUMMARY', styles['SectionHeader']))
+            story.append(_para(summary, styles['Summary']))
         
         # CORE COMPETENCIES / SKILLS
-        if resume_data.get('skills'):
-            story.append(Paragraph('CORE COMPETENCIES', self.styles['SectionHeader']))
-            
-            skills = resume_data['skills']
+        if skills:
+            story.append(_para('CORE COMPETENCIES', styles['SectionHeader']))
             
-            # Create a 3-column layout for skills
-            skill_data = []
+            # Create a 3-column layout for skills, filled top to bottom
             num_cols = 3
             num_rows = (len(skills) + num_cols - 1) // num_cols
-            
-            for row in range(num_rows):
-                row_data = []
-                for col in range(num_cols):
-                    idx = row + col * num_rows
-                    if idx < len(skills):
-                        # Add bullet point
-                        skill_text = f"• {skills[idx]}"
-                        row_data.append(Paragraph(skill_text, self.styles['Skill']))
-                    else:
-                        row_data.append("")
-                skill_data.append(row_data)
+            cells = [_para(f"• {skill}", styles['Skill']) for skill in skills]
+            columns = [cells[k * num_rows:(k + 1) * num_rows] for k in range(num_cols)]
+            skill_data = [list(row) for row in zip_longest(*columns, fillvalue="")]
             
             if skill_data:
                 skill_table = Table(
                     skill_data,
-                    colWidths=[2.2*inch, 2.2*inch, 2.2*inch],
-                    style=TableStyle([
-                        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-                        ('TOPPADDING', (0, 0), (-1, -1), 2),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-                    ])
+                    colWidths=self._SKILL_COL_WIDTHS,
+                    style=self._SKILL_TABLE_STYLE
                 )
                 story.append(skill_table)
-                story.append(Spacer(1, 0.15*inch))
+                story.append(Spacer(1, self._SKILLS_GAP))
         
         # PROFESSIONAL EXPERIENCE
-        if resume_data.get('experience'):
-            story.append(Paragraph('PROFESSIONAL EXPERIENCE', self.styles['SectionHeader']))
+        if experience:
+            story.append(_para('PROFESSIONAL EXPERIENCE', styles['SectionHeader']))
             
-            for exp in resume_data['experience']:
+            for exp in experience:
                 # Keep experience together on same page
                 exp_content = []
                 
                 # Company and dates on same line using table
                 company_date_data = [[
-                    Paragraph(exp.get('company', ''), self.styles['Company']),
-                    Paragraph(exp.get('dates', ''), self.styles['Dates'])
+                    _para(exp.get('company', ''), styles['Company']),
+                    _para(exp.get('dates', ''), styles['Dates'])
                 ]]
                 
                 company_date_table = Table(
                     company_date_data,
-                    colWidths=[4.5*inch, 2*inch],
-                    style=TableStyle([
-                        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                        ('LEFTPADDING', (0, 0), (0, 0), 0),
-                        ('RIGHTPADDING', (-1, -1), (-1, -1), 0),
-                        ('TOPPADDING', (0, 0), (-1, -1), 0),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-                    ])
+                    colWidths=self._COMPANY_DATE_WIDTHS,
+                    style=self._COMPANY_DATE_STYLE
                 )
                 exp_content.append(company_date_table)
                 
                 # Job title
-                exp_content.append(Paragraph(exp.get('title', ''), self.styles['JobTitle']))
+                exp_content.append(_para(exp.get('title', ''), styles['JobTitle']))
                 
                 # Bullet points
                 for bullet in exp.get('bullets', []):
@@ -302,24 +362,22 @@ class ProfessionalResumePDF:
                     bullet_text = bullet.strip()
                     if not bullet_text.startswith('•'):
                         bullet_text = f"• {bullet_text}"
-                    exp_content.append(Paragraph(bullet_text, self.styles['Bullet']))
+                    exp_content.append(_para(bullet_text, styles['Bullet']))
                 
-                exp_content.append(Spacer(1, 0.1*inch))
+                exp_content.append(Spacer(1, self._EXPERIENCE_GAP))
                 
                 # Keep experience section together
                 story.append(KeepTogether(exp_content))
         
         # EDUCATION
-        if resume_data.get('education'):
-            story.append(Paragraph('EDUCATION', self.styles['SectionHeader']))
+        if education:
+            story.append(_para('EDUCATION', styles['SectionHeader']))
             
-            for edu in resume_data['education']:
-                edu_text = f"<b>{edu.get('degree', '')}</b>"
-                if edu.get('school'):
-                    edu_text += f" | {edu['school']}"
-                if edu.get('year'):
-                    edu_text += f" | {edu['year']}"
-                story.append(Paragraph(edu_text, self.styles['Education']))
+            for edu in education:
+                parts = [f"<b>{edu.get('degree', '')}</b>"]
+                parts += [str(edu[key]) for key in ('school', 'year') if edu.get(key)]
+                edu_text = " | ".join(parts)
+                story.append(Paragraph(edu_text, styles['Education']))
         
         # Build the PDF
         doc.build(story)
@@ -327,11 +385,31 @@ class ProfessionalResumePDF:
     
     def generate_from_text(self, resume_text, output_path):
         """Convert plain text resume to professional PDF"""
-        # Parse the text into structured data
-        resume_data = self._parse_resume_text(resume_text)
+        # Parse the text into structured data (cached; read-only)
+        resume_data = self._parse_resume_text_cached(resume_text)
         return self.generate_pdf(resume_data, output_path)
     
-    def _parse_resume_text(self, text):
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _parse_resume_text_cached(text):
+        """
+        Parsed resume shared across generate_from_text calls on the same text
+        Lists become tuples and dicts read-only views, so no caller can
+        alter the cached copy
+        """
+        data = ProfessionalResumePDF._parse_resume_text(text)
+        return MappingProxyType({
+            **data,
+            'skills': tuple(data['skills']),
+            'experience': tuple(
+                MappingProxyType({**exp, 'bullets': tuple(exp['bullets'])})
+                for exp in data['experience']
+            ),
+            'education': tuple(MappingProxyType(edu) for edu in data['education']),
+        })
+    
+    @staticmethod
+    def _parse_resume_text(text):
         """Parse plain text resume into structured format"""
         lines = text.strip().split('\n')
         
@@ -345,6 +423,11 @@ class ProfessionalResumePDF:
             'education': []
         }
         
+        # The section lists are filled through locals rather than dict lookups
+        skills = resume_data['skills']
+        experience = resume_data['experience']
+        education = resume_data['education']
+        
         current_section = None
         current_exp = None
         summary_lines = []
@@ -356,6 +439,7 @@ class ProfessionalResumePDF:
             if not line:
                 i += 1
                 continue
+            upper = line.upper()
             
             # Parse sections based on keywords
             if i == 0:  # First line is name
@@ -364,64 +448,55 @@ class ProfessionalResumePDF:
                 resume_data['contact'] = line
             elif i == 2 and ('|' in line or 'Candidate' in line):  # Title line
                 resume_data['title'] = line
-            elif 'PROFESSIONAL SUMMARY' in line.upper():
-                current_section = 'summary'
-                summary_lines = []
-            elif 'CORE COMPETENCIES' in line.upper() or 'SKILLS' in line.upper():
-                current_section = 'skills'
-                if summary_lines and not resume_data['summary']:
-                    resume_data['summary'] = ' '.join(summary_lines)
-            elif 'PROFESSIONAL EXPERIENCE' in line.upper() or 'WORK EXPERIENCE' in line.upper():
-                current_section = 'experience'
-            elif 'EDUCATION' in line.upper():
-                current_section = 'education'
-                if current_exp:
-                    resume_data['experience'].append(current_exp)
-                    current_exp = None
+            elif (headings := _SECTION_RE.findall(upper)):
+                # Earliest section in _SECTION_ORDER wins if a line names several
+                current_section = min(map(_SECTIONS.get, headings), key=_SECTION_ORDER.index)
+                if current_section == 'summary':
+                    summary_lines = []
+                elif current_section == 'skills':
+                    if summary_lines and not resume_data['summary']:
+                        resume_data['summary'] = ' '.join(summary_lines)
+                elif current_section == 'education':
+                    if current_exp:
+                        experience.append(current_exp)
+                        current_exp = None
             else:
                 # Process content based on current section
+                # (lines naming a section heading never reach this branch)
                 if current_section == 'summary':
-                    if not any(keyword in line.upper() for keyword in ['CORE COMPETENCIES', 'SKILLS', 'PROFESSIONAL EXPERIENCE']):
-                        summary_lines.append(line)
+                    summary_lines.append(line)
                 
                 elif current_section == 'skills':
                     if line.startswith('•'):
-                        skill = line[1:].strip()
-                        resume_data['skills'].append(skill)
-                    elif line and not any(keyword in line.upper() for keyword in ['PROFESSIONAL', 'EXPERIENCE', 'EDUCATION']):
+                        # line is already stripped, so only the left side is left
+                        skills.append(line[1:].lstrip())
+                    elif 'PROFESSIONAL' not in upper and 'EXPERIENCE' not in upper:
                         # Handle skills without bullets
-                        resume_data['skills'].append(line)
+                        skills.append(line)
                 
                 elif current_section == 'experience':
                     # Detect new company (usually has dates like "2020 - 2023")
-                    if any(year in line for year in ['2020', '2021', '2022', '2023', '2024', '2025']) and '–' in line:
+                    if '–' in line and _YEAR_RE.search(line):
                         if current_exp:
-                            resume_data['experience'].append(current_exp)
+                            experience.append(current_exp)
                         
                         # Parse company and dates
-                        parts = line.rsplit(' ', 4)  # Split from right to get dates
-                        dates = ''
-                        company = line
-                        
-                        # Try to extract dates
-                        for j in range(len(parts)):
-                            if '–' in parts[j] or '-' in parts[j]:
-                                dates = ' '.join(parts[j:])
-                                company = ' '.join(parts[:j])
-                                break
+                        m = _COMPANY_DATES_RE.match(line)
+                        company, dates = (m['company'], m['dates']) if m else (line, '')
                         
                         current_exp = {
-                            'company': company.strip(),
-                            'dates': dates.strip(),
+                            'company': company,
+                            'dates': dates,
                             'title': '',
                             'bullets': []
                         }
-                    elif current_exp and not current_exp['title'] and not line.startswith('•'):
-                        # This is likely the job title
-                        current_exp['title'] = line
-                    elif current_exp and line.startswith('•'):
-                        # Bullet point
-                        current_exp['bullets'].append(line[1:].strip())
+                    elif current_exp:
+                        if line.startswith('•'):
+                            # Bullet point
+                            current_exp['bullets'].append(line[1:].lstrip())
+                        elif not current_exp['title']:
+                            # This is likely the job title
+                            current_exp['title'] = line
                 
                 elif current_section == 'education':
                     # Parse education entries
@@ -437,13 +512,13 @@ class ProfessionalResumePDF:
                     else:
                         edu_entry['degree'] = line
                     
-                    resume_data['education'].append(edu_entry)
+                    education.append(edu_entry)
             
             i += 1
         
         # Add final experience if exists
         if current_exp:
-            resume_data['experience'].append(current_exp)
+            experience.append(current_exp)
         
         # Add summary if not already added
         if summary_lines and not resume_data['summary']:
@@ -452,6 +527,15 @@ class ProfessionalResumePDF:
         return resume_data
 
 
+@functools.lru_cache(maxsize=1)
+def _shared_generator():
+    """
+    One generator per process, built on first use
+    Styles are only read while building, so calls (and threads) can share it
+    """
+    return ProfessionalResumePDF()
+
+
 # Standalone function for easy integration
 def create_professional_pdf(resume_text_or_data, output_path):
     """
@@ -459,12 +543,12 @@ def create_professional_pdf(resume_text_or_data, output_path):
     
     Args:
         resume_text_or_data: Either plain text resume or structured dict
-        output_path: Where to save the PDF
+        output_path: Where to save the PDF (a path or a binary file object)
     
     Returns:
-        Path to generated PDF
+        Path to generated PDF (or the file object passed in)
     """
-    generator = ProfessionalResumePDF()
+    generator = _shared_generator()
     
     if isinstance(resume_text_or_data, str):
         # Plain text input
@@ -474,6 +558,30 @@ def create_professional_pdf(resume_text_or_data, output_path):
         return generator.generate_pdf(resume_text_or_data, output_path)
 
 
+def create_many(jobs, workers=None):
+    """
+    Create several professional PDFs in parallel worker processes
+    
+    Each document is laid out independently and layout is CPU-bound
+    Python, so processes (not threads) give the speedup.
+    
+    Args:
+        jobs: (resume_text_or_data, output_path) pairs
+        workers: Number of worker processes (default: os.cpu_count())
+    
+    Returns:
+        List of generated PDF paths, in the same order as jobs
+    """
+    jobs = list(jobs)
+    if len(jobs) < 2 or workers == 1:
+        return [create_professional_pdf(source, path) for source, path in jobs]
+    
+    sources = [source for source, _ in jobs]
+    paths = [path for _, path in jobs]
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        return list(executor.map(create_professional_pdf, sources, paths))
+
+
 # Example usage
 if __name__ == "__main__":
     # Test with sample resume data